@@ -100,7 +100,8 @@ class TestEndToEnd:
         
         # Verify AWS calls
         mock_sts.get_caller_identity.assert_called_once()
-        mock_ec2.describe_security_groups.assert_called_once_with(GroupIds=['sg-123456'])
+        # EC2 reports a missing group on authorize; no lookup beforehand
+        mock_ec2.describe_security_groups.assert_not_called()
         mock_ec2.authorize_security_group_ingress.assert_called_once()
     
     @patch('boto3.client')
@@ -0,0 +1,470 @@
+"""Unit tests for Azure NSG service wrapper."""
+
+import sys
+
+import pytest
+from unittest.mock import Mock, patch
+
+from azure.core.exceptions import AzureError, HttpResponseError, ResourceNotModifiedError
+from azure.mgmt.network.models import NetworkSecurityGroup, SecurityRule
+
+from whitelistmcp.azure.service import (
+    AzureService,
+    AzureCredentials,
+    NSGRule,
+    NSG_UPDATE_ATTEMPTS,
+    _azure_credentials,
+    _first_free_priority,
+    _normalize_prefix,
+    _normalize_prefix_cached,
+    create_rule_description,
+    create_rule_descriptions
+)
+from whitelistmcp.utils.ip_validator import IPValidationError
+
+
+def _security_rule(name, prefix, port="22", protocol="Tcp", priority=100,
+                   direction="Inbound", access="Allow", description=None):
+    """Build a stand-in for an azure SecurityRule."""
+    rule = Mock()
+    rule.name = name
+    rule.source_address_prefix = prefix
+    rule.destination_port_range = port
+    rule.protocol = protocol
+    rule.priority = priority
+    rule.direction = direction
+    rule.access = access
+    rule.source_port_range = "*"
+    rule.destination_address_prefix = "*"
+    rule.description = description
+    return rule
+
+
+class TestAzureService:
+    """Test Azure service wrapper."""
+    
+    @pytest.fixture
+    def service(self, mock_azure_client):
+        """Create Azure service backed by a mocked network client."""
+        service = AzureService(AzureCredentials(
+            client_id="client",
+            client_secret="secret",
+            tenant_id="tenant",
+            subscription_id="sub"
+        ))
+        service._client = mock_azure_client
+        return service
+    
+    @patch("azure.mgmt.network.NetworkManagementClient")
+    @patch("azure.identity.ClientSecretCredential")
+    def test_client_shares_credential(self, mock_credential, mock_network_client):
+        """Test services for the same principal share one credential."""
+        credentials = AzureCredentials(client_id="client", client_secret="secret",
+                                       tenant_id="tenant", subscription_id="sub")
+        
+        first = AzureService(credentials).client
+        second = AzureService(AzureCredentials(client_id="client", client_secret="secret",
+                                               tenant_id="tenant", subscription_id="other")).client
+        
+        assert first is not None and second is not None
+        mock_credential.assert_called_once_with(
+            tenant_id="tenant", client_id="client", client_secret="secret"
+        )
+        assert mock_network_client.call_count == 2
+        assert "secret" not in repr(list(_azure_credentials._entries))
+    
+    def test_client_incomplete_credentials(self):
+        """Test a missing secret is rejected before building a credential."""
+        service = AzureService(AzureCredentials(client_id="client", tenant_id="tenant"))
+        
+        with pytest.raises(ValueError, match="incomplete"):
+            service.client
+    
+    def test_incomplete_credentials_fail_add_and_remove(self):
+        """Test add and remove both report incomplete credentials as a failed result."""
+        service = AzureService(AzureCredentials(client_id="client", tenant_id="tenant"))
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="ssh", priority=0,
+                       source_address_prefix="10.0.0.10/32", destination_port_range="22")
+        
+        added = service.add_whitelist_rule(rule)
+        removed = service.remove_whitelist_rule("test-nsg", "rg", port=22)
+        
+        assert added.success is False and "incomplete" in added.error
+        assert removed.success is False and "incomplete" in removed.error
+    
+    def test_remove_whitelist_rule_starts_all_deletes_first(self, service, mock_azure_client):
+        """Test deletes are all started before any is awaited."""
+        nsg = mock_azure_client.network_security_groups.get.return_value
+        nsg.security_rules = [
+            _security_rule("rule-a", "10.0.0.1/32"),
+            _security_rule("rule-b", "10.0.0.2/32"),
+        ]
+        events = []
+        
+        def begin_delete(**kwargs):
+            name = kwargs["security_rule_name"]
+            events.append(("begin", name))
+            poller = Mock()
+            poller.result.side_effect = lambda: events.append(("wait", name))
+            return poller
+        
+        mock_azure_client.security_rules.begin_delete.side_effect = begin_delete
+        
+        result = service.remove_whitelist_rule("test-nsg", "rg", port=22)
+        
+        assert result.success is True
+        assert "removed 2 rule(s)" in result.message
+        assert events == [
+            ("begin", "rule-a"), ("begin", "rule-b"),
+            ("wait", "rule-a"), ("wait", "rule-b"),
+        ]
+    
+    def test_remove_whitelist_rule_matches_bare_prefix(self, service, mock_azure_client):
+        """Test a rule stored without a prefix length matches its /32 form."""
+        nsg = mock_azure_client.network_security_groups.get.return_value
+        nsg.security_rules = [
+            _security_rule("bare", "10.0.0.1"),
+            _security_rule("tag", "Internet"),
+        ]
+        
+        result = service.remove_whitelist_rule("test-nsg", "rg", ip_address="10.0.0.1/32")
+        
+        assert result.success is True
+        delete = mock_azure_client.security_rules.begin_delete
+        delete.assert_called_once()
+        assert delete.call_args.kwargs["security_rule_name"] == "bare"
+    
+    def test_remove_whitelist_rule_ignores_cache(self, service, mock_azure_client):
+        """Test removal matches against a fresh copy of the NSG."""
+        stale = Mock(security_rules=[])
+        current = Mock(security_rules=[_security_rule("ssh", "10.0.0.1/32")])
+        mock_azure_client.network_security_groups.get.side_effect = [stale, current]
+        service.list_whitelist_rules("test-nsg", "rg")
+        
+        result = service.remove_whitelist_rule("test-nsg", "rg", port=22)
+        
+        assert result.success is True
+        assert mock_azure_client.network_security_groups.get.call_count == 2
+        mock_azure_client.security_rules.begin_delete.assert_called_once()
+    
+    def test_add_whitelist_rules_single_update(self, service, mock_azure_client):
+        """Test bulk add fetches and writes the NSG once and fills priority gaps."""
+        nsg = mock_azure_client.network_security_groups.get.return_value
+        nsg.security_rules = [_security_rule("existing", "10.0.0.9/32", priority=100)]
+        rules = [
+            NSGRule(nsg_name="test-nsg", resource_group="rg", name="", priority=0,
+                    source_address_prefix=f"10.0.1.{i}/32", destination_port_range="443")
+            for i in range(2)
+        ]
+        
+        results = service.add_whitelist_rules(rules)
+        
+        assert [r.success for r in results] == [True, True]
+        assert [r.priority for r in rules] == [110, 120]
+        assert [r.name for r in rules] == ["allow-10-0-1-0-32-443", "allow-10-0-1-1-32-443"]
+        mock_azure_client.network_security_groups.get.assert_called_once()
+        mock_azure_client.network_security_groups.begin_create_or_update.assert_called_once()
+        mock_azure_client.security_rules.begin_create_or_update.assert_not_called()
+        written = mock_azure_client.network_security_groups.begin_create_or_update.call_args.kwargs
+        assert [r.name for r in written["parameters"].security_rules] == [
+            "existing", "allow-10-0-1-0-32-443", "allow-10-0-1-1-32-443"
+        ]
+    
+    def test_add_whitelist_rules_leaves_cached_nsg_untouched(self, service, mock_azure_client):
+        """Test the NSG shared with readers is not changed to build the update."""
+        existing = SecurityRule(name="existing", priority=100, direction="Inbound",
+                                access="Allow", protocol="Tcp",
+                                source_address_prefix="10.0.0.9/32", destination_port_range="22")
+        nsg = NetworkSecurityGroup(location="eastus", tags={"team": "ops"},
+                                   security_rules=[existing])
+        nsg.etag = 'W/"1"'
+        mock_azure_client.network_security_groups.get.return_value = nsg
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="https", priority=0,
+                       source_address_prefix="10.0.1.1/32", destination_port_range="443")
+        
+        service.add_whitelist_rules([rule])
+        
+        assert nsg.security_rules == [existing]
+        put = mock_azure_client.network_security_groups.begin_create_or_update
+        written = put.call_args.kwargs["parameters"]
+        assert written.tags == {"team": "ops"}
+        assert [r.name for r in written.security_rules] == ["existing", "https"]
+    
+    def test_generated_name_is_azure_safe(self, service):
+        """Test generated rule names replace CIDR and IPv6 separators."""
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="", priority=100,
+                       source_address_prefix="2001:db8::1/128", destination_port_range="22")
+        
+        assert service._to_security_rule(rule).name == "allow-2001-db8--1-128-22"
+    
+    def test_add_whitelist_rule_replaces_same_name(self, service, mock_azure_client):
+        """Test adding a rule with an existing name updates it in place."""
+        nsg = mock_azure_client.network_security_groups.get.return_value
+        nsg.security_rules = [_security_rule("ssh", "10.0.0.9/32", priority=100)]
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="ssh", priority=0,
+                       source_address_prefix="10.0.0.10/32", destination_port_range="22")
+        
+        result = service.add_whitelist_rule(rule)
+        
+        assert result.success is True
+        assert rule.priority == 100
+        call = mock_azure_client.security_rules.begin_create_or_update.call_args.kwargs
+        assert call["security_rule_name"] == "ssh"
+        assert call["security_rule_parameters"].source_address_prefix == "10.0.0.10/32"
+        mock_azure_client.network_security_groups.begin_create_or_update.assert_not_called()
+    
+    def test_add_whitelist_rules_retries_on_concurrent_change(self, service, mock_azure_client):
+        """Test a whole-NSG write that loses an etag race is rebuilt, not forced."""
+        stale = NetworkSecurityGroup(location="eastus", security_rules=[])
+        stale.etag = 'W/"1"'
+        current = NetworkSecurityGroup(location="eastus", security_rules=[
+            SecurityRule(name="other", priority=100, direction="Inbound", access="Allow",
+                         protocol="Tcp", source_address_prefix="10.0.0.9/32",
+                         destination_port_range="22")
+        ])
+        current.etag = 'W/"2"'
+        mock_azure_client.network_security_groups.get.side_effect = [stale, current]
+        put = mock_azure_client.network_security_groups.begin_create_or_update
+        put.side_effect = [
+            HttpResponseError(message="etag mismatch", response=Mock(status_code=412, reason="")),
+            Mock()
+        ]
+        rules = [
+            NSGRule(nsg_name="test-nsg", resource_group="rg", name=f"rule-{i}", priority=0,
+                    source_address_prefix=f"10.0.1.{i}/32", destination_port_range="443")
+            for i in range(2)
+        ]
+        
+        results = service.add_whitelist_rules(rules)
+        
+        assert all(r.success for r in results)
+        assert [call.kwargs["headers"] for call in put.call_args_list] == [
+            {"If-Match": 'W/"1"'}, {"If-Match": 'W/"2"'}
+        ]
+        written = put.call_args.kwargs["parameters"].security_rules
+        assert [r.name for r in written] == ["other", "rule-0", "rule-1"]
+        assert [r.priority for r in rules] == [110, 120]
+    
+    def test_add_whitelist_rules_gives_up_after_repeated_conflicts(
+        self, service, mock_azure_client
+    ):
+        """Test persistent etag conflicts become failed results."""
+        put = mock_azure_client.network_security_groups.begin_create_or_update
+        put.side_effect = HttpResponseError(
+            message="etag mismatch", response=Mock(status_code=412, reason="")
+        )
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="ssh", priority=0,
+                       source_address_prefix="10.0.0.10/32", destination_port_range="22")
+        
+        results = service.add_whitelist_rules([rule])
+        
+        assert results[0].success is False
+        assert put.call_count == NSG_UPDATE_ATTEMPTS
+    
+    def test_nsg_cached_between_reads(self, service, mock_azure_client):
+        """Test read paths reuse a recently fetched NSG until it is modified."""
+        nsg = mock_azure_client.network_security_groups.get.return_value
+        nsg.security_rules = [_security_rule("ssh", "10.0.0.1/32")]
+        
+        service.list_whitelist_rules("test-nsg", "rg")
+        assert service.check_whitelist_rule("test-nsg", "rg", "10.0.0.1", port=22) is True
+        assert mock_azure_client.network_security_groups.get.call_count == 1
+        
+        service.add_whitelist_rule(NSGRule(
+            nsg_name="test-nsg", resource_group="rg", name="https", priority=0,
+            source_address_prefix="10.0.0.2/32", destination_port_range="443"
+        ))
+        service.list_whitelist_rules("test-nsg", "rg")
+        assert mock_azure_client.network_security_groups.get.call_count == 3
+    
+    def test_add_whitelist_rule_multi_one_update_per_nsg(self, service, mock_azure_client):
+        """Test rules are grouped per NSG and results keep input order."""
+        rules = [
+            NSGRule(nsg_name=nsg, resource_group="rg", name=f"rule-{i}", priority=0,
+                    source_address_prefix=f"10.0.1.{i}/32", destination_port_range="443")
+            for i, nsg in enumerate(["nsg-a", "nsg-b", "nsg-a"])
+        ]
+        
+        results = service.add_whitelist_rule_multi(rules)
+        
+        assert [r.rule.name for r in results] == ["rule-0", "rule-1", "rule-2"]
+        assert all(r.success for r in results)
+        assert mock_azure_client.network_security_groups.begin_create_or_update.call_count == 2
+    
+    def test_add_whitelist_rule_multi_reports_failed_group(self, service, mock_azure_client):
+        """Test one NSG failing does not hide the results of NSGs already written."""
+        def put(**kwargs):
+            if kwargs["network_security_group_name"] == "nsg-b":
+                raise RuntimeError("bug")
+            return Mock()
+        
+        mock_azure_client.network_security_groups.begin_create_or_update.side_effect = put
+        rules = [
+            NSGRule(nsg_name=nsg, resource_group="rg", name=f"rule-{i}", priority=0,
+                    source_address_prefix=f"10.0.1.{i}/32", destination_port_range="443")
+            for i, nsg in enumerate(["nsg-a", "nsg-b", "nsg-a"])
+        ]
+        
+        results = service.add_whitelist_rule_multi(rules)
+        
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "bug"
+    
+    def test_add_whitelist_rule_azure_error(self, service, mock_azure_client):
+        """Test Azure SDK errors become a failed result."""
+        put = mock_azure_client.security_rules.begin_create_or_update
+        put.side_effect = AzureError("throttled")
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="ssh", priority=0,
+                       source_address_prefix="10.0.0.10/32", destination_port_range="22")
+        
+        result = service.add_whitelist_rule(rule)
+        
+        assert result.success is False
+        assert result.error == "throttled"
+    
+    def test_add_whitelist_rule_unexpected_error_propagates(self, service, mock_azure_client):
+        """Test errors outside the Azure SDK are not swallowed."""
+        mock_azure_client.security_rules.begin_create_or_update.side_effect = RuntimeError("bug")
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="ssh", priority=0,
+                       source_address_prefix="10.0.0.10/32", destination_port_range="22")
+        
+        with pytest.raises(RuntimeError):
+            service.add_whitelist_rule(rule)
+    
+    def test_iter_whitelist_rules_is_lazy(self, service, mock_azure_client):
+        """Test rules are yielded one at a time and only inbound allows are listed."""
+        nsg = mock_azure_client.network_security_groups.get.return_value
+        nsg.security_rules = [
+            _security_rule("rule-a", "10.0.0.1/32"),
+            _security_rule("deny", "10.0.0.2/32", access="Deny"),
+            _security_rule("rule-b", "10.0.0.3/32"),
+        ]
+        
+        rules = service.iter_whitelist_rules("test-nsg", "rg")
+        
+        assert next(rules).name == "rule-a"
+        listed = service.list_whitelist_rules("test-nsg", "rg")
+        assert [rule.name for rule in listed] == ["rule-a", "rule-b"]
+    
+    def test_list_whitelist_rules_error_returns_empty(self, service, mock_azure_client):
+        """Test list_whitelist_rules swallows fetch errors."""
+        mock_azure_client.network_security_groups.get.side_effect = AzureError("boom")
+        
+        assert service.list_whitelist_rules("test-nsg", "rg") == []
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_nsg_rule_has_slots(self):
+        """Test NSGRule instances carry no per-instance __dict__."""
+        rule = NSGRule(nsg_name="test-nsg", resource_group="rg", name="ssh", priority=100)
+        
+        assert not hasattr(rule, "__dict__")
+    
+    def test_disk_cache_revalidates_with_etag(self, mock_azure_client, tmp_path):
+        """Test a new service reuses the on-disk NSG when Azure answers 304."""
+        credentials = AzureCredentials(subscription_id="sub", use_default_credential=True)
+        nsg = NetworkSecurityGroup(location="eastus", security_rules=[
+            SecurityRule(name="ssh", priority=100, direction="Inbound", access="Allow",
+                         protocol="Tcp", source_address_prefix="10.0.0.1/32",
+                         destination_port_range="22")
+        ])
+        nsg.etag = 'W/"1"'
+        mock_azure_client.network_security_groups.get.return_value = nsg
+        
+        first = AzureService(credentials, disk_cache_dir=str(tmp_path))
+        first._client = mock_azure_client
+        assert [r.name for r in first.list_whitelist_rules("test-nsg", "rg")] == ["ssh"]
+        
+        mock_azure_client.network_security_groups.get.side_effect = ResourceNotModifiedError()
+        second = AzureService(credentials, disk_cache_dir=str(tmp_path))
+        second._client = mock_azure_client
+        
+        assert second.check_whitelist_rule("test-nsg", "rg", "10.0.0.1", port=22) is True
+        assert mock_azure_client.network_security_groups.get.call_args.kwargs["headers"] == {
+            "If-None-Match": 'W/"1"'
+        }
+    
+    def test_get_next_priority_fills_first_gap(self, service):
+        """Test the next priority is the lowest free slot for the direction."""
+        nsg = Mock()
+        nsg.security_rules = [
+            _security_rule("a", "10.0.0.1/32", priority=100),
+            _security_rule("b", "10.0.0.2/32", priority=120),
+            _security_rule("c", "10.0.0.3/32", priority=110, direction="Outbound"),
+        ]
+        
+        assert service._get_next_priority(nsg) == 110
+        assert service._get_next_priority(nsg, "Outbound") == 100
+    
+    @pytest.mark.parametrize("used,expected", [
+        (set(), 100),
+        ({100, 105, 110, 130}, 120),
+        ({50, 100, 65000}, 110),
+        ({100, 115}, 110),
+    ])
+    def test_first_free_priority(self, used, expected):
+        """Test off-grid and out-of-range priorities do not hide free slots."""
+        assert _first_free_priority(used) == expected
+    
+    def test_first_free_priority_exhausted(self):
+        """Test a full priority range is reported."""
+        with pytest.raises(ValueError, match="No available priority"):
+            _first_free_priority(set(range(100, 4000, 10)))
+    
+    def test_service_tag_prefix_normalized_once(self):
+        """Test a service tag is cached like an address, not re-parsed per call."""
+        _normalize_prefix_cached.cache_clear()
+        with patch("whitelistmcp.azure.service.normalize_ip_input",
+                   side_effect=IPValidationError("not an IP")) as normalize:
+            assert _normalize_prefix("AzureLoadBalancer") == "AzureLoadBalancer"
+            assert _normalize_prefix("AzureLoadBalancer") == "AzureLoadBalancer"
+        
+        normalize.assert_called_once_with("AzureLoadBalancer")
+        assert _normalize_prefix(None) is None
+    
+    @pytest.mark.parametrize("ip,port,protocol,expected", [
+        ("10.0.0.1", 22, "Tcp", True),
+        ("10.0.0.1", None, "tcp", True),
+        ("10.0.0.1", 443, "Tcp", False),
+        ("10.0.0.1", 22, "Udp", False),
+        ("10.0.0.2", 22, "Tcp", False),
+        ("10.0.0.3/32", 22, "Tcp", True),
+        ("10.1.2.3", 22, "Tcp", True),
+        ("10.1.2.0/24", None, "tcp", True),
+        ("10.1.2.3", 443, "Tcp", False),
+        ("10.0.0.0/8", 22, "Tcp", False),
+        ("2001:db8::1", 22, "Tcp", False),
+    ])
+    def test_check_whitelist_rule(self, service, mock_azure_client, ip, port, protocol, expected):
+        """Test checking an IP/port/protocol against inbound allow rules."""
+        nsg = mock_azure_client.network_security_groups.get.return_value
+        nsg.security_rules = [
+            _security_rule("ssh", "10.0.0.1/32"),
+            _security_rule("deny", "10.0.0.2/32", access="Deny"),
+            _security_rule("bare", "10.0.0.3"),
+            _security_rule("tag", "Internet"),
+            _security_rule("subnet", "10.1.0.0/16"),
+            _security_rule("prefixes", None),
+        ]
+        
+        checked = service.check_whitelist_rule("test-nsg", "rg", ip, port=port, protocol=protocol)
+        assert checked is expected
+
+
+class TestCreateRuleDescriptions:
+    """Test batch rule description creation."""
+    
+    def test_batch_shares_one_description(self):
+        """Test a batch formats the template once and truncates to Azure's limit."""
+        descriptions = create_rule_descriptions("{user}-{timestamp}-" + "x" * 200, 3, user="ops")
+        
+        assert len(descriptions) == 3
+        assert len(set(descriptions)) == 1
+        assert descriptions[0].startswith("ops-")
+        assert len(descriptions[0]) == 140
+    
+    def test_precomputed_timestamp(self):
+        """Test a caller-supplied timestamp is used as-is."""
+        description = create_rule_description("{service}@{timestamp}", service_name="ssh",
+                                              timestamp="20240101-0000")
+        
+        assert description == "ssh@20240101-0000"
@@ -0,0 +1,54 @@
+"""Unit tests for credential cache utilities."""
+
+from whitelistmcp.utils.cache import CredentialCache, credentials_digest
+
+
+class TestCredentialsDigest:
+    """Test credentials_digest function."""
+    
+    def test_digest_hides_values(self):
+        """Test the digest is stable and does not contain the secret."""
+        digest = credentials_digest("key", "topsecret", None)
+        
+        assert digest == credentials_digest("key", "topsecret", None)
+        assert digest != credentials_digest("key", "other", None)
+        assert "topsecret" not in digest
+    
+    def test_digest_of_nested_values(self):
+        """Test dict values are digested by content, independent of key order."""
+        assert credentials_digest({"a": 1, "b": [2]}) == credentials_digest({"b": [2], "a": 1})
+
+
+class TestCredentialCache:
+    """Test CredentialCache class."""
+    
+    def test_builds_once_per_credentials(self):
+        """Test the same credentials reuse one built object."""
+        cache: CredentialCache[object] = CredentialCache(max_entries=4)
+        
+        first = cache.get_or_create(object, "key", "secret")
+        
+        assert cache.get_or_create(object, "key", "secret") is first
+        assert cache.get_or_create(object, "key", "other") is not first
+        assert len(cache) == 2
+    
+    def test_evicts_least_recently_used(self):
+        """Test the cache keeps at most max_entries objects."""
+        cache: CredentialCache[object] = CredentialCache(max_entries=2)
+        first = cache.get_or_create(object, "first")
+        cache.get_or_create(object, "second")
+        cache.get_or_create(object, "first")
+        
+        cache.get_or_create(object, "third")
+        
+        assert len(cache) == 2
+        assert cache.get_or_create(object, "first") is first
+    
+    def test_clear(self):
+        """Test clear drops every cached object."""
+        cache: CredentialCache[object] = CredentialCache(max_entries=2)
+        first = cache.get_or_create(object, "first")
+        
+        cache.clear()
+        
+        assert cache.get_or_create(object, "first") is not first
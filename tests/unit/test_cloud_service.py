@@ -1,10 +1,15 @@
 """Unit tests for cloud service module."""
 
+import json
+import sys
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from concurrent.futures import Future
 
 from whitelistmcp.cloud_service import (
+    DEFAULT_MAX_WORKERS,
     CloudServiceManager,
     CloudCredentials,
     UnifiedWhitelistResult
@@ -58,6 +63,13 @@ class TestUnifiedWhitelistResult:
         assert result.message == "Rule added successfully"
         assert result.error is None
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_result_has_slots(self):
+        """Test results carry no per-instance __dict__."""
+        result = UnifiedWhitelistResult(cloud=CloudProvider.AWS, success=True, message="ok")
+        
+        assert not hasattr(result, "__dict__")
+    
     def test_error_result(self):
         """Test error result."""
         result = UnifiedWhitelistResult(
@@ -85,6 +97,8 @@ class TestCloudServiceManager:
         config.default_parameters.description_template = "Rule for {service}"
         config.default_parameters.azure_resource_group = "test-rg"
         config.default_parameters.gcp_network = "default"
+        config.default_parameters.cloud_timeout = 120.0
+        config.default_parameters.azure_nsg_cache_dir = None
         return config
     
     @pytest.fixture
@@ -96,6 +110,13 @@ class TestCloudServiceManager:
         """Test manager initialization."""
         assert manager.config == mock_config
         assert manager.executor is not None
+        assert manager.executor._max_workers == DEFAULT_MAX_WORKERS
+    
+    def test_initialization_max_workers(self, mock_config):
+        """Test the shared pool size can be set explicitly."""
+        manager = CloudServiceManager(mock_config, max_workers=5)
+        
+        assert manager.executor._max_workers == 5
     
     @patch('whitelistmcp.cloud_service.AWSService')
     def test_add_whitelist_rule_aws_only(self, mock_aws_service, manager):
@@ -251,6 +272,179 @@ class TestCloudServiceManager:
         # This test is kept as a placeholder for future implementation
         pytest.skip("list_whitelist_rules method not implemented in CloudServiceManager")
     
+    @patch('whitelistmcp.cloud_service.AWSService')
+    def test_add_aws_rule_details_are_fields_only(self, mock_aws_service, manager):
+        """Test rule details hold the model fields, not cached properties."""
+        def add_rule(rule):
+            # The service reads these cached properties when authorizing
+            rule.aws_dict, rule.network
+            return AWSResult(success=True, message="AWS rule added", rule=rule)
+        
+        mock_aws_service.return_value.add_whitelist_rule.side_effect = add_rule
+        
+        results = manager.add_whitelist_rule(
+            credentials=CloudCredentials(cloud=CloudProvider.AWS, aws_credentials=Mock()),
+            target="sg-12345678",
+            ip_address="192.168.1.1"
+        )
+        
+        details = results[0].details["rule"]
+        assert details["cidr_ip"] == "192.168.1.1/32"
+        assert "network" not in details and "aws_dict" not in details
+        json.dumps(details)
+    
+    @patch('whitelistmcp.cloud_service.AWSService')
+    @patch('whitelistmcp.cloud_service.AzureService')
+    def test_add_whitelist_rules_bulk(self, mock_azure_service, mock_aws_service, manager):
+        """Test bulk adds fan out per AWS rule and write Azure rules together."""
+        mock_aws = mock_aws_service.return_value
+        mock_azure = mock_azure_service.return_value
+        mock_aws.add_whitelist_rule.return_value = AWSResult(success=True, message="AWS rule added")
+        mock_azure.add_whitelist_rules.side_effect = lambda rules: [
+            AzureResult(success=True, message="Azure rule added", rule=rule) for rule in rules
+        ]
+        
+        creds = CloudCredentials(
+            cloud=CloudProvider.ALL,
+            aws_credentials=Mock(),
+            azure_credentials=Mock()
+        )
+        
+        results = manager.add_whitelist_rules_bulk(
+            credentials=creds,
+            target="test-target",
+            ip_addresses=["192.168.1.1", "192.168.1.2", "not-an-ip"]
+        )
+        
+        assert len(results) == 6
+        assert mock_aws.add_whitelist_rule.call_count == 2
+        mock_azure.add_whitelist_rules.assert_called_once()
+        azure_rules = mock_azure.add_whitelist_rules.call_args.args[0]
+        assert [r.source_address_prefix for r in azure_rules] == ["192.168.1.1/32", "192.168.1.2/32"]
+        assert [r.name for r in azure_rules] == ["allow-192-168-1-1-22", "allow-192-168-1-2-22"]
+        assert sum(not r.success for r in results) == 2
+    
+    @patch('whitelistmcp.cloud_service.AzureService')
+    def test_add_whitelist_rules_bulk_azure_duplicate_ips(self, mock_azure_service, manager):
+        """Test a repeated address yields one Azure rule but a result per address."""
+        mock_azure = mock_azure_service.return_value
+        mock_azure.add_whitelist_rules.side_effect = lambda rules: [
+            AzureResult(success=True, message="Azure rule added", rule=rule) for rule in rules
+        ]
+        creds = CloudCredentials(cloud=CloudProvider.AZURE, azure_credentials=Mock())
+        
+        results = manager.add_whitelist_rules_bulk(
+            credentials=creds,
+            target="test-nsg",
+            ip_addresses=["192.168.1.1", "192.168.1.2", "192.168.1.1"]
+        )
+        
+        azure_rules = mock_azure.add_whitelist_rules.call_args.args[0]
+        assert [r.name for r in azure_rules] == ["allow-192-168-1-1-22", "allow-192-168-1-2-22"]
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert results[2].details == results[0].details
+    
+    @patch('whitelistmcp.cloud_service.AWSService')
+    def test_services_reused_per_credentials(self, mock_aws_service, manager):
+        """Test services are cached per credentials and rebuilt after expiry."""
+        creds = Mock(access_key_id="AKIA1", secret_access_key="s", session_token=None, region="us-east-1")
+        other = Mock(access_key_id="AKIA2", secret_access_key="s", session_token=None, region="us-east-1")
+        
+        first = manager._get_aws_service(creds)
+        assert manager._get_aws_service(creds) is first
+        manager._get_aws_service(other)
+        assert mock_aws_service.call_count == 2
+        
+        with patch('whitelistmcp.cloud_service.time.monotonic', return_value=float("inf")):
+            manager._get_aws_service(creds)
+        assert mock_aws_service.call_count == 3
+    
+    @patch('whitelistmcp.cloud_service.SERVICE_CACHE_MAX_ENTRIES', 2)
+    @patch('whitelistmcp.cloud_service.AWSService')
+    def test_service_cache_bounded_and_keyed_by_digest(self, mock_aws_service, manager):
+        """Test the service cache evicts old entries and never stores raw secrets."""
+        for i in range(3):
+            manager._get_aws_service(Mock(access_key_id=f"AKIA{i}", secret_access_key="topsecret",
+                                          session_token=None, region="us-east-1"))
+        
+        assert len(manager._service_cache) == 2
+        assert "topsecret" not in repr(list(manager._service_cache))
+        
+        with patch('whitelistmcp.cloud_service.time.monotonic', return_value=float("inf")):
+            manager._get_aws_service(Mock(access_key_id="AKIA9", secret_access_key="s",
+                                          session_token=None, region="us-east-1"))
+        assert len(manager._service_cache) == 1
+    
+    def test_service_built_outside_cache_lock(self, manager):
+        """Test a slow service build does not hold up lookups for other keys."""
+        def build_aws():
+            # Would deadlock if the cache lock were held while building
+            return manager._cached_service((CloudProvider.GCP, "other"), object)
+        
+        service = manager._cached_service((CloudProvider.AWS, "digest"), build_aws)
+        
+        assert manager._cached_service((CloudProvider.AWS, "digest"), object) is service
+        assert manager._cached_service((CloudProvider.GCP, "other"), object) is service
+    
+    @patch('whitelistmcp.cloud_service.AzureService')
+    def test_azure_service_gets_configured_cache_dir(self, mock_azure_service, manager, mock_config):
+        """Test the configured NSG snapshot directory reaches the Azure service."""
+        mock_config.default_parameters.azure_nsg_cache_dir = "/var/cache/whitelistmcp"
+        credentials = Mock(tenant_id="t", client_id="c", client_secret="s",
+                           subscription_id="sub", use_default_credential=False)
+        
+        manager._get_azure_service(credentials)
+        
+        mock_azure_service.assert_called_once_with(credentials, disk_cache_dir="/var/cache/whitelistmcp")
+    
+    def test_run_tasks_keeps_task_order(self, manager):
+        """Test results follow task order and failures are wrapped."""
+        def ok():
+            return UnifiedWhitelistResult(cloud=CloudProvider.GCP, success=True, message="ok")
+        
+        def failed():
+            raise RuntimeError("boom")
+        
+        results = manager._run_tasks(
+            [(CloudProvider.GCP, ok, ()), (CloudProvider.AWS, failed, ())],
+            "add rule to"
+        )
+        
+        assert [r.cloud for r in results] == [CloudProvider.GCP, CloudProvider.AWS]
+        assert results[1].success is False
+        assert results[1].error == "boom"
+    
+    def test_run_tasks_times_out_slow_cloud(self, manager):
+        """Test a cloud exceeding the timeout does not hold up the others."""
+        release = threading.Event()
+        manager.config.default_parameters.cloud_timeout = 0.05
+        
+        def ok():
+            return UnifiedWhitelistResult(cloud=CloudProvider.AWS, success=True, message="ok")
+        
+        try:
+            results = manager._run_tasks(
+                [(CloudProvider.AWS, ok, ()), (CloudProvider.AZURE, release.wait, ())],
+                "add rule to"
+            )
+        finally:
+            release.set()
+        
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error == "No response within 0.05s"
+    
+    def test_run_tasks_single_task_skips_executor(self, manager):
+        """Test a single-cloud operation runs on the calling thread."""
+        manager.executor = Mock()
+        
+        results = manager._run_tasks([(CloudProvider.AWS, Mock(side_effect=RuntimeError("boom")), ())], "add rule to")
+        
+        manager.executor.submit.assert_not_called()
+        assert results[0].success is False
+        assert results[0].error == "boom"
+    
     def test_invalid_cloud_provider(self, manager):
         """Test handling invalid cloud provider."""
         creds = CloudCredentials(cloud=CloudProvider.AWS)
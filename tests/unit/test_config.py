@@ -8,7 +8,7 @@ from unittest.mock import patch, mock_open
 
 from whitelistmcp.config import (
     Config, CloudProvider, DefaultParameters, SecuritySettings,
-    PortMapping, CredentialProfile, load_config, get_port_number
+    PortMapping, CredentialProfile, load_config, get_port_number, _CONFIG_CACHE
 )
 
 
@@ -84,6 +84,12 @@ class TestDefaultParameters:
         # Invalid regions
         with pytest.raises(ValueError, match="Invalid Azure region"):
             DefaultParameters(azure_region="invalid region")
+    
+    @pytest.mark.parametrize("region", ["1eastus", "EastUS", "east-us", "eästus"])
+    def test_azure_region_rejects_non_lowercase_ascii(self, region):
+        """Test Azure regions must be lowercase ASCII starting with a letter."""
+        with pytest.raises(ValueError, match="Invalid Azure region"):
+            DefaultParameters(azure_region=region)
 
 
 class TestSecuritySettings:
@@ -109,6 +115,10 @@ class TestSecuritySettings:
         # Invalid CIDR range
         with pytest.raises(ValueError, match="Invalid CIDR format"):
             SecuritySettings(allowed_ip_ranges=["192.168.1.1"])
+        
+        # Octets out of range
+        with pytest.raises(ValueError, match="Invalid CIDR format"):
+            SecuritySettings(allowed_ip_ranges=["300.168.1.0/24"])
     
     def test_rate_limit_validation(self):
         """Test rate limit validation."""
@@ -187,6 +197,28 @@ class TestConfig:
         assert config.get_profile("test") == profile
         assert config.get_profile("nonexistent") is None
     
+    def test_get_profile_after_mutation(self):
+        """Test profile lookups see profiles added or renamed after first use."""
+        config = Config(credential_profiles=[CredentialProfile(name="first")])
+        assert config.get_profile("second") is None
+        
+        added = CredentialProfile(name="second")
+        config.credential_profiles.append(added)
+        assert config.get_profile("second") is added
+        
+        config.credential_profiles[0].name = "renamed"
+        assert config.get_profile("first") is None
+        assert config.get_profile("renamed") is config.credential_profiles[0]
+    
+    def test_get_port_mapping_miss_reuses_index(self):
+        """Test looking up an unmapped name does not rebuild the index."""
+        config = Config(port_mappings=[PortMapping(name="https", port=443)])
+        assert config.get_port_mapping("ssh") is None
+        index = config._port_index
+        
+        assert config.get_port_mapping("ssh") is None
+        assert config._port_index is index
+    
     def test_get_port_mapping(self):
         """Test getting port mapping by name."""
         mapping = PortMapping(name="https", port=443)
@@ -219,6 +251,24 @@ class TestConfig:
         assert config.security_settings.rate_limit_per_minute == 120
         assert len(config.port_mappings) == 1
     
+    def test_from_validated_dict_round_trip(self):
+        """Test rebuilding a config from its own dump without validation."""
+        config = Config(
+            credential_profiles=[CredentialProfile(name="test", cloud=CloudProvider.AZURE)],
+            default_parameters=DefaultParameters(port=443),
+            security_settings=SecuritySettings(allowed_ip_ranges=["10.0.0.0/8"]),
+            port_mappings=[PortMapping(name="https", port=443)]
+        )
+        
+        rebuilt = Config.from_validated_dict(config.to_dict())
+        
+        assert rebuilt == config
+        assert isinstance(rebuilt.credential_profiles[0], CredentialProfile)
+        assert isinstance(rebuilt.default_parameters, DefaultParameters)
+        assert rebuilt.get_profile("test").cloud == CloudProvider.AZURE
+        rebuilt.security_settings.allowed_ip_ranges.append("192.168.0.0/16")
+        assert config.security_settings.allowed_ip_ranges == ["10.0.0.0/8"]
+    
     def test_to_dict(self):
         """Test converting config to dictionary."""
         config = Config()
@@ -228,6 +278,26 @@ class TestConfig:
         assert "default_parameters" in data
         assert "security_settings" in data
         assert "port_mappings" in data
+    
+    def test_to_dict_matches_model_dump(self):
+        """Test to_dict returns an independent copy equal to model_dump."""
+        config = Config(
+            credential_profiles=[
+                CredentialProfile(name="gcp", cloud=CloudProvider.GCP, gcp_credentials_json={"keys": {"id": "1"}})
+            ],
+            security_settings=SecuritySettings(allowed_ip_ranges=["10.0.0.0/8"]),
+            port_mappings=[PortMapping(name="https", port=443)]
+        )
+        
+        data = config.to_dict()
+        assert data == config.model_dump()
+        
+        data["credential_profiles"][0]["gcp_credentials_json"]["keys"]["id"] = "2"
+        data["security_settings"]["allowed_ip_ranges"].append("192.168.0.0/16")
+        data["port_mappings"][0]["port"] = 8443
+        assert config.credential_profiles[0].gcp_credentials_json == {"keys": {"id": "1"}}
+        assert config.security_settings.allowed_ip_ranges == ["10.0.0.0/8"]
+        assert config.port_mappings[0].port == 443
 
 
 class TestLoadConfig:
@@ -253,6 +323,17 @@ class TestLoadConfig:
         config = load_config("nonexistent.json")
         assert isinstance(config, Config)
     
+    @patch.dict(os.environ, {}, clear=True)
+    def test_load_config_defaults_without_file_or_env(self, tmp_path):
+        """Test the no-file, no-environment path matches an all-defaults Config."""
+        config = load_config(str(tmp_path / "missing.json"))
+        assert config == Config()
+        
+        config.credential_profiles.append(CredentialProfile(name="added"))
+        config.default_parameters.port = 8080
+        again = load_config(str(tmp_path / "missing.json"))
+        assert again == Config()
+    
     @patch.dict(os.environ, {
         "CLOUD_PROVIDER": "azure",
         "WHITELIST_MCP_PORT": "443",
@@ -270,6 +351,12 @@ class TestLoadConfig:
         assert config.default_parameters.azure_region == "westeurope"
         assert config.default_parameters.gcp_region == "europe-west1"
     
+    @patch.dict(os.environ, {"AZURE_NSG_CACHE_DIR": "/var/cache/whitelistmcp"})
+    def test_load_config_azure_nsg_cache_dir(self):
+        """Test the NSG snapshot directory can be set from the environment."""
+        config = load_config()
+        assert config.default_parameters.azure_nsg_cache_dir == "/var/cache/whitelistmcp"
+    
     @patch.dict(os.environ, {
         "WHITELIST_MCP_PORT": "invalid",
         "WHITELIST_MCP_RATE_LIMIT": "invalid"
@@ -280,6 +367,32 @@ class TestLoadConfig:
         captured = capsys.readouterr()
         assert "Warning: Invalid port" in captured.err
         assert "Warning: Invalid rate limit" in captured.err
+    
+    def test_load_config_cached_until_file_changes(self, tmp_path):
+        """Test repeat loads reuse the parsed file until it changes."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"default_parameters": {"port": 8080}}')
+        
+        first = load_config(str(config_file))
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            second = load_config(str(config_file))
+        
+        assert second.default_parameters.port == 8080
+        second.default_parameters.port = 9090
+        assert first.default_parameters.port == 8080
+        
+        config_file.write_text('{"default_parameters": {"port": 443}}')
+        assert load_config(str(config_file)).default_parameters.port == 443
+    
+    def test_load_config_cache_keeps_latest_per_path(self, tmp_path):
+        """Test rewriting a config replaces its cache entry instead of adding one."""
+        config_file = tmp_path / "config.json"
+        for port in (8080, 8081, 8082):
+            config_file.write_text(f'{{"default_parameters": {{"port": {port}}}}}')
+            os.utime(config_file, ns=(port, port))
+            assert load_config(str(config_file)).default_parameters.port == port
+        
+        assert len(_CONFIG_CACHE) == 1
 
 
 class TestGetPortNumber:
@@ -290,10 +403,18 @@ class TestGetPortNumber:
         assert get_port_number("22", mock_config) == 22
         assert get_port_number("443", mock_config) == 443
     
+    @pytest.mark.parametrize("port_input", [" 443", "443 ", "+443", "\t443\n"])
+    def test_numeric_port_with_whitespace_or_sign(self, mock_config, port_input):
+        """Test numeric ports accept what int() accepts."""
+        assert get_port_number(port_input, mock_config) == 443
+    
     def test_invalid_numeric_port(self, mock_config):
         """Test invalid numeric port."""
         with pytest.raises(ValueError, match="Invalid port"):
             get_port_number("99999", mock_config)
+        
+        with pytest.raises(ValueError, match="between 1 and 65535"):
+            get_port_number("0", mock_config)
     
     def test_common_port_names(self, mock_config):
         """Test common port name mappings."""
@@ -1,20 +1,44 @@
 """Unit tests for IP validation utilities."""
 
 import pytest
+import ipaddress
 from ipaddress import IPv4Network, IPv6Network
+from requests.exceptions import RequestException
 
 from whitelistmcp.utils.ip_validator import (
     validate_ip_address,
     validate_cidr_block,
     normalize_ip_input,
+    get_current_ip,
     IPValidationError,
     ip_in_cidr,
     is_private_ip,
     is_public_ip,
-    cidr_overlap
+    cidr_overlap,
+    ip_rule_name_part
 )
 
 
+class _FakeSocket:
+    """Minimal UDP socket stand-in for the local fallback path."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def connect(self, address):
+        pass
+    
+    def getsockname(self):
+        return ("10.0.0.5", 54321)
+
+
+def _raise_request_exception(*args, **kwargs):
+    raise RequestException("network disabled")
+
+
 class TestValidateIPAddress:
     """Test validate_ip_address function."""
     
@@ -73,6 +97,19 @@ class TestValidateCIDRBlock:
         assert validate_cidr_block("192.168.1.0/24/24") is False
         assert validate_cidr_block(None) is False
     
+    @pytest.mark.parametrize("cidr", [
+        "1.2.3.4/24", "255.255.255.255/32", "01.2.3.4/24", "1.2.3.4/032",
+        "1.2.3.4/33", "1.2.3.256/8", "1.2.3.4/24\n", "1.2.3/24",
+    ])
+    def test_ipv4_fast_path_matches_ipaddress(self, cidr):
+        """Test the IPv4 regex fast path agrees with the ipaddress parser."""
+        try:
+            ipaddress.ip_network(cidr, strict=False)
+            expected = True
+        except ValueError:
+            expected = False
+        assert validate_cidr_block(cidr) is expected
+    
     def test_valid_ipv6_cidr(self):
         """Test valid IPv6 CIDR blocks."""
         assert validate_cidr_block("2001:db8::/32") is True
@@ -128,6 +165,24 @@ class TestNormalizeIPInput:
             normalize_ip_input("192.168.1.0/33")
 
 
+class TestGetCurrentIP:
+    """Test get_current_ip function."""
+    
+    def test_get_current_ip_with_fallback(self, monkeypatch):
+        """Test falling back to the local socket when all services fail."""
+        monkeypatch.setattr("whitelistmcp.utils.ip_validator.requests.get", _raise_request_exception)
+        monkeypatch.setattr("whitelistmcp.utils.ip_validator.socket.socket", lambda *_: _FakeSocket())
+        
+        assert get_current_ip() == {'ip': '10.0.0.5', 'source': 'local_socket'}
+    
+    def test_get_current_ip_all_methods_fail(self, monkeypatch):
+        """Test result when both the services and the socket fallback fail."""
+        monkeypatch.setattr("whitelistmcp.utils.ip_validator.requests.get", _raise_request_exception)
+        monkeypatch.setattr("whitelistmcp.utils.ip_validator.socket.socket", _raise_request_exception)
+        
+        assert get_current_ip() == {'ip': None, 'source': 'failed'}
+
+
 class TestIPInCIDR:
     """Test ip_in_cidr function."""
     
@@ -232,6 +287,19 @@ class TestCIDROverlap:
             cidr_overlap("192.168.1.0/24", "invalid")
 
 
+class TestIPRuleNamePart:
+    """Test ip_rule_name_part function."""
+    
+    @pytest.mark.parametrize("ip,expected", [
+        ("10.0.0.1", "10-0-0-1"),
+        ("10.0.0.0/24", "10-0-0-0-24"),
+        ("2001:db8::1/128", "2001-db8--1-128"),
+    ])
+    def test_separators_replaced(self, ip, expected):
+        """Test dots, slashes and colons become dashes."""
+        assert ip_rule_name_part(ip) == expected
+
+
 class TestIPValidationError:
     """Test IPValidationError exception."""
     
@@ -19,6 +19,13 @@ replacements = [
     ("whitelist/list", "whitelist_list"),
     ("whitelist/check", "whitelist_check"),
 ]
+renames = dict(replacements)
+
+# Old names quoted ('...' or "...") or space-delimited as in comments,
+# matched for all replacements in a single pass
+method_pattern = re.compile(
+    r"([\"' ])(" + "|".join(re.escape(old) for old, _ in replacements) + r")\1"
+)
 
 def update_file(filepath):
     """Update method names in a file."""
@@ -30,12 +37,10 @@ def update_file(filepath):
         content = f.read()
     
     original = content
-    for old, new in replacements:
-        # Update in strings
-        content = content.replace(f'"{old}"', f'"{new}"')
-        content = content.replace(f"'{old}'", f"'{new}'")
-        # Update in comments
-        content = content.replace(f" {old} ", f" {new} ")
+    content = method_pattern.sub(
+        lambda m: m.group(1) + renames[m.group(2)] + m.group(1),
+        content
+    )
     
     if content != original:
         with open(filepath, 'w') as f:
@@ -1,26 +1,67 @@
 """AWS service wrapper for security group management."""
 
-from typing import List, Optional, Dict, Any, Union
+import functools
+import ipaddress
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Iterator, Mapping, Tuple, Union
+from dataclasses import dataclass
 from datetime import datetime, timezone
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
+from whitelistmcp.utils.cache import CredentialCache
 from whitelistmcp.utils.credential_validator import AWSCredentials
 from whitelistmcp.utils.ip_validator import validate_cidr_block
 from whitelistmcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_VALID_PROTOCOLS = ["tcp", "udp", "icmp", "-1"]
+
+# Matches {name} placeholders in rule description templates
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Default lifetime of cached DescribeSecurityGroups results, in seconds; kept
+# short since changes made outside this process are invisible until it expires
+DEFAULT_SG_CACHE_TTL = 5.0
+
+# Most security groups kept in the shared cache; least recently used go first
+SG_CACHE_MAX_ENTRIES = 256
+
+# Upper bound on concurrent revoke calls when a batch revoke is rejected
+MAX_REVOKE_WORKERS = 8
+
+# HTTPS connections kept per EC2 client. Clients are shared across threads
+# (revoke fallback, multi-cloud fan-out), and botocore's default of 10 would
+# drop and re-handshake connections beyond that.
+EC2_MAX_POOL_CONNECTIONS = 50
+
+# Fail fast on unreachable endpoints instead of botocore's 60s defaults, and
+# let botocore's adaptive mode back off when EC2 throttles
+EC2_CONNECT_TIMEOUT = 3
+EC2_READ_TIMEOUT = 10
+EC2_RETRIES = {"max_attempts": 3, "mode": "adaptive"}
+
 
 class AWSServiceError(Exception):
     """Exception raised for AWS service errors."""
     pass
 
 
+# SecurityGroupRule cached properties, stored in the instance __dict__
+_DERIVED_ATTRIBUTES = ("network", "aws_dict")
+
+
 class SecurityGroupRule(BaseModel):
     """Security group rule model."""
     
+    # Immutable so derived values (network, aws_dict) can be cached safely
+    model_config = ConfigDict(frozen=True)
+    
     group_id: str
     ip_protocol: str = "tcp"
     from_port: int = 22
@@ -28,30 +69,28 @@ class SecurityGroupRule(BaseModel):
     cidr_ip: str
     description: str = ""
     
-    @field_validator("cidr_ip")
-    def validate_cidr(cls, v: str) -> str:
-        """Validate CIDR block format."""
-        if not validate_cidr_block(v):
-            raise ValueError(f"Invalid CIDR block: {v}")
-        return v
-    
-    @field_validator("from_port", "to_port")
-    def validate_ports(cls, v: int) -> int:
-        """Validate port numbers."""
-        if not 0 <= v <= 65535:
-            raise ValueError(f"Port must be between 0 and 65535, got {v}")
-        return v
-    
-    @field_validator("ip_protocol")
-    def validate_protocol(cls, v: str) -> str:
-        """Validate IP protocol."""
-        valid_protocols = ["tcp", "udp", "icmp", "-1"]
-        if v not in valid_protocols:
-            raise ValueError(f"Invalid protocol: {v}. Must be one of {valid_protocols}")
-        return v
+    @model_validator(mode="after")
+    def validate_rule(self) -> "SecurityGroupRule":
+        """Validate CIDR block, port numbers and IP protocol in one pass."""
+        if not validate_cidr_block(self.cidr_ip):
+            raise ValueError(f"Invalid CIDR block: {self.cidr_ip}")
+        for port in (self.from_port, self.to_port):
+            if not 0 <= port <= 65535:
+                raise ValueError(f"Port must be between 0 and 65535, got {port}")
+        if self.ip_protocol not in _VALID_PROTOCOLS:
+            raise ValueError(
+                f"Invalid protocol: {self.ip_protocol}. Must be one of {_VALID_PROTOCOLS}"
+            )
+        return self
     
-    def to_aws_dict(self) -> Dict[str, Any]:
-        """Convert to AWS API format."""
+    @functools.cached_property
+    def network(self) -> Union[ipaddress.IPv4Network, ipaddress.IPv6Network]:
+        """Parsed form of cidr_ip, for comparisons independent of notation."""
+        return ipaddress.ip_network(self.cidr_ip, strict=False)
+    
+    @functools.cached_property
+    def aws_dict(self) -> Dict[str, Any]:
+        """AWS API (IpPermissions entry) form of this rule, built once."""
         return {
             "IpProtocol": self.ip_protocol,
             "FromPort": self.from_port,
@@ -61,9 +100,30 @@ class SecurityGroupRule(BaseModel):
                 "Description": self.description
             }]
         }
+    
+    def model_copy(
+        self,
+        *,
+        update: Optional[Mapping[str, Any]] = None,
+        deep: bool = False
+    ) -> "SecurityGroupRule":
+        """Copy the rule, dropping cached derived values that ``update`` may invalidate."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _DERIVED_ATTRIBUTES:
+            copied.__dict__.pop(name, None)
+        return copied
+    
+    def to_aws_dict(self) -> Dict[str, Any]:
+        """Convert to AWS API format.
+        
+        Returns a copy, so callers may modify it without affecting the rule.
+        """
+        aws_dict = self.aws_dict
+        return {**aws_dict, "IpRanges": [dict(ip_range) for ip_range in aws_dict["IpRanges"]]}
 
 
-class WhitelistResult(BaseModel):
+@dataclass
+class WhitelistResult:
     """Result of a whitelist operation."""
     
     success: bool
@@ -75,6 +135,11 @@ class WhitelistResult(BaseModel):
 def create_rule_description(template: str, **kwargs) -> str:
     """Create rule description from template.
     
+    Only bare ``{name}`` placeholders with a value are substituted, in a
+    single pass; anything else in the template (unknown placeholders, doubled
+    braces, format specs such as ``{date:%Y}``) is kept as written, and
+    substituted values are not scanned for further placeholders.
+    
     Args:
         template: Description template with placeholders
         **kwargs: Values to substitute in template
@@ -88,60 +153,183 @@ def create_rule_description(template: str, **kwargs) -> str:
         - {reason}: Reason for access
         - Any other custom placeholders
     """
+    if "{" not in template:
+        return template
+    
     # Add default values
     values = {
         'date': datetime.now(timezone.utc).isoformat(),
         **kwargs
     }
     
-    # Simple template substitution
-    description = template
-    for key, value in values.items():
-        placeholder = f"{{{key}}}"
-        if placeholder in description:
-            description = description.replace(placeholder, str(value))
+    return _PLACEHOLDER_RE.sub(
+        lambda m: str(values[m.group(1)]) if m.group(1) in values else m.group(0),
+        template
+    )
+
+
+# boto3's default session is not safe to build clients from concurrently
+_client_lock = threading.Lock()
+
+
+# EC2 clients keyed by a digest of their credentials
+_ec2_clients: CredentialCache[Any] = CredentialCache(max_entries=32)
+
+
+def _get_ec2_client(
+    access_key_id: str,
+    secret_access_key: str,
+    session_token: Optional[str],
+    region: str
+) -> Any:
+    """Create an EC2 client, reusing one per distinct credential set.
     
-    return description
+    Args:
+        access_key_id: AWS access key ID
+        secret_access_key: AWS secret access key
+        session_token: Optional session token
+        region: AWS region
+    
+    Returns:
+        boto3 EC2 client
+    """
+    def build() -> Any:
+        # Imported on first use; boto3 is slow to load and unused until a client is needed
+        import boto3
+        from botocore.config import Config as BotoConfig
+        
+        with _client_lock:
+            return boto3.client(
+                'ec2',
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                aws_session_token=session_token,
+                region_name=region,
+                config=BotoConfig(
+                    max_pool_connections=EC2_MAX_POOL_CONNECTIONS,
+                    connect_timeout=EC2_CONNECT_TIMEOUT,
+                    read_timeout=EC2_READ_TIMEOUT,
+                    retries=EC2_RETRIES
+                )
+            )
+    
+    return _ec2_clients.get_or_create(
+        build, access_key_id, secret_access_key, session_token, region
+    )
+
+
+def _iter_ip_ranges(permissions: List[Dict[str, Any]]) -> Iterator[Tuple[str, int, int, str, str]]:
+    """Flatten EC2 ingress permissions into one tuple per CIDR range.
+    
+    Args:
+        permissions: IpPermissions list from DescribeSecurityGroups
+    
+    Yields:
+        (protocol, from_port, to_port, cidr, description) for each IPv4
+        range of a permission followed by its IPv6 ranges
+    """
+    for permission in permissions:
+        protocol = permission.get('IpProtocol', 'tcp')
+        from_port = permission.get('FromPort', 0)
+        to_port = permission.get('ToPort', 0)
+        for ip_range in permission.get('IpRanges', ()):
+            cidr = ip_range['CidrIp']
+            yield protocol, from_port, to_port, cidr, ip_range.get('Description', '')
+        for ipv6_range in permission.get('Ipv6Ranges', ()):
+            cidr = ipv6_range['CidrIpv6']
+            yield protocol, from_port, to_port, cidr, ipv6_range.get('Description', '')
 
 
 class AWSService:
     """AWS service wrapper for security group operations."""
     
-    def __init__(self, credentials: AWSCredentials):
+    # Security group descriptions shared across instances and threads, keyed by
+    # (access key, region, group id) -> (fetched at, security group), in LRU order
+    _sg_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _sg_cache_lock = threading.Lock()
+    
+    def __init__(self, credentials: AWSCredentials, cache_ttl: float = DEFAULT_SG_CACHE_TTL):
         """Initialize AWS service with credentials.
         
         Args:
             credentials: AWS credentials for authentication
+            cache_ttl: Seconds to reuse a fetched security group; 0 disables caching
         """
         self.credentials = credentials
+        self.cache_ttl = cache_ttl
         self.ec2_client = self._create_ec2_client()
     
     def _create_ec2_client(self) -> Any:
-        """Create EC2 client with credentials."""
-        return boto3.client(
-            'ec2',
-            aws_access_key_id=self.credentials.access_key_id,
-            aws_secret_access_key=self.credentials.secret_access_key,
-            aws_session_token=self.credentials.session_token,
-            region_name=self.credentials.region
+        """Get EC2 client for these credentials, shared across instances."""
+        return _get_ec2_client(
+            self.credentials.access_key_id,
+            self.credentials.secret_access_key,
+            self.credentials.session_token,
+            self.credentials.region
         )
     
-    def get_security_group(self, group_id: str) -> Optional[Dict[str, Any]]:
+    def _sg_cache_key(self, group_id: str) -> Tuple[str, str, str]:
+        """Build the security group cache key for these credentials."""
+        return (self.credentials.access_key_id, self.credentials.region, group_id)
+    
+    def invalidate_security_group_cache(self, group_id: str) -> None:
+        """Drop any cached description of a security group.
+        
+        Args:
+            group_id: Security group ID
+        """
+        with self._sg_cache_lock:
+            self._sg_cache.pop(self._sg_cache_key(group_id), None)
+    
+    def _get_cached_security_group(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        """Return a cached security group that has not expired, dropping it if it has."""
+        with self._sg_cache_lock:
+            cached = self._sg_cache.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= self.cache_ttl:
+                del self._sg_cache[key]
+                return None
+            self._sg_cache.move_to_end(key)
+            return cached[1]
+    
+    def _cache_security_group(self, key: Tuple[str, str, str], sg: Dict[str, Any]) -> None:
+        """Cache a security group, evicting the least recently used past the size cap."""
+        with self._sg_cache_lock:
+            self._sg_cache[key] = (time.monotonic(), sg)
+            self._sg_cache.move_to_end(key)
+            while len(self._sg_cache) > SG_CACHE_MAX_ENTRIES:
+                self._sg_cache.popitem(last=False)
+    
+    def get_security_group(self, group_id: str, fresh: bool = False) -> Optional[Dict[str, Any]]:
         """Get security group details.
         
+        Results are cached for ``cache_ttl`` seconds; mutations made through
+        this service invalidate the cached entry.
+        
         Args:
             group_id: Security group ID
+            fresh: Skip the cache and always query EC2, e.g. before a mutation
         
         Returns:
             Security group details or None if not found
         """
+        key = self._sg_cache_key(group_id)
+        if self.cache_ttl > 0 and not fresh:
+            cached = self._get_cached_security_group(key)
+            if cached is not None:
+                return cached
+        
         try:
             response = self.ec2_client.describe_security_groups(
                 GroupIds=[group_id]
             )
             
             if response['SecurityGroups']:
-                return response['SecurityGroups'][0]
+                sg = response['SecurityGroups'][0]
+                if self.cache_ttl > 0:
+                    self._cache_security_group(key, sg)
+                return sg
             return None
             
         except ClientError as e:
@@ -161,19 +349,13 @@ class AWSService:
             WhitelistResult indicating success or failure
         """
         try:
-            # Check if security group exists
-            sg = self.get_security_group(rule.group_id)
-            if not sg:
-                return WhitelistResult(
-                    success=False,
-                    error=f"Security group {rule.group_id} not found"
-                )
-            
-            # Add the rule
+            # EC2 reports a missing group or duplicate rule atomically, so no
+            # existence lookup is made beforehand
             response = self.ec2_client.authorize_security_group_ingress(
                 GroupId=rule.group_id,
-                IpPermissions=[rule.to_aws_dict()]
+                IpPermissions=[rule.aws_dict]
             )
+            self.invalidate_security_group_cache(rule.group_id)
             
             return WhitelistResult(
                 success=True,
@@ -189,6 +371,11 @@ class AWSService:
                     success=False,
                     error="Rule already exists in security group"
                 )
+            elif error_code == 'InvalidGroup.NotFound':
+                return WhitelistResult(
+                    success=False,
+                    error=f"Security group {rule.group_id} not found"
+                )
             elif error_code == 'RulesPerSecurityGroupLimitExceeded':
                 return WhitelistResult(
                     success=False,
@@ -227,8 +414,8 @@ class AWSService:
             WhitelistResult indicating success or failure
         """
         try:
-            # Get all rules
-            all_rules = self.list_whitelist_rules(security_group_id)
+            # Get all rules; always fresh, since revokes are matched against them
+            all_rules = self.list_whitelist_rules(security_group_id, fresh=True)
             
             if not all_rules:
                 return WhitelistResult(
@@ -247,31 +434,37 @@ class AWSService:
                         error=f"Invalid IP address: {ip_address}"
                     )
             
+            # Narrow to the most selective criterion first (exact CIDR, then
+            # single port) so the remaining checks only see candidates
+            port_int = int(port) if isinstance(port, str) else port
+            if ip_address:
+                target_net = ipaddress.ip_network(ip_address, strict=False)
+                candidates = [rule for rule in all_rules if rule.network == target_net]
+            elif port_int is not None:
+                candidates = [
+                    rule for rule in all_rules
+                    if rule.from_port == port_int and rule.to_port == port_int
+                ]
+            else:
+                candidates = all_rules
+            
             # Find rules to remove
+            protocol_lower = protocol.lower() if protocol else None
             rules_to_remove = []
-            for rule in all_rules:
-                match = True
-                
-                # Check IP match
-                if ip_address and rule.cidr_ip != ip_address:
-                    match = False
-                
+            for rule in candidates:
                 # Check port match
-                if port is not None:
-                    port_int = int(port) if isinstance(port, str) else port
-                    if rule.from_port != port_int or rule.to_port != port_int:
-                        match = False
+                if port_int is not None and not (rule.from_port == port_int == rule.to_port):
+                    continue
                 
                 # Check service name match (in description)
                 if service_name and (not rule.description or service_name not in rule.description):
-                    match = False
+                    continue
                 
                 # Check protocol match
-                if protocol and rule.ip_protocol.lower() != protocol.lower():
-                    match = False
+                if protocol_lower and rule.ip_protocol.lower() != protocol_lower:
+                    continue
                 
-                if match:
-                    rules_to_remove.append(rule)
+                rules_to_remove.append(rule)
             
             if not rules_to_remove:
                 criteria = []
@@ -287,23 +480,43 @@ class AWSService:
                     error=f"No matching rules found for {', '.join(criteria)}"
                 )
             
-            # Remove the rules
-            removed_count = 0
-            failed_count = 0
-            
-            for rule in rules_to_remove:
-                try:
-                    self.ec2_client.revoke_security_group_ingress(
-                        GroupId=security_group_id,
-                        IpPermissions=[rule.to_aws_dict()]
+            # Revoke all matching rules in one call; EC2 reports any it could
+            # not find in UnknownIpPermissions instead of failing the batch
+            try:
+                response = self.ec2_client.revoke_security_group_ingress(
+                    GroupId=security_group_id,
+                    IpPermissions=[rule.aws_dict for rule in rules_to_remove]
+                )
+            except (ClientError, BotoCoreError) as e:
+                logger.warning(f"Batch revoke failed, retrying rules individually: {str(e)}")
+                removed_count, failed_count = self._revoke_rules_individually(
+                    security_group_id, rules_to_remove
+                )
+            else:
+                unknown = {
+                    (
+                        perm.get('IpProtocol'),
+                        perm.get('FromPort'),
+                        perm.get('ToPort'),
+                        ip_range.get('CidrIp')
                     )
-                    removed_count += 1
-                    logger.info(f"Removed rule: {rule.cidr_ip}:{rule.from_port}")
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Failed to remove rule {rule.cidr_ip}:{rule.from_port}: {str(e)}")
+                    for perm in response.get('UnknownIpPermissions', [])
+                    for ip_range in perm.get('IpRanges', [])
+                }
+                removed_count = 0
+                failed_count = 0
+                for rule in rules_to_remove:
+                    if (rule.ip_protocol, rule.from_port, rule.to_port, rule.cidr_ip) in unknown:
+                        failed_count += 1
+                        logger.error(
+                            f"Failed to remove rule {rule.cidr_ip}:{rule.from_port}: rule not found"
+                        )
+                    else:
+                        removed_count += 1
+                        logger.info(f"Removed rule: {rule.cidr_ip}:{rule.from_port}")
             
             if removed_count > 0:
+                self.invalidate_security_group_cache(security_group_id)
                 message = f"Successfully removed {removed_count} rule(s)"
                 if failed_count > 0:
                     message += f" ({failed_count} failed)"
@@ -323,6 +536,46 @@ class AWSService:
                 error=f"Unexpected error: {str(e)}"
             )
     
+    def _revoke_rules_individually(
+        self,
+        security_group_id: str,
+        rules: List[SecurityGroupRule]
+    ) -> Tuple[int, int]:
+        """Revoke rules with one call each, issued concurrently.
+        
+        Args:
+            security_group_id: Security group ID
+            rules: Rules to revoke
+        
+        Returns:
+            Tuple of (removed count, failed count)
+        """
+        removed_count = 0
+        failed_count = 0
+        
+        # boto3 clients are thread-safe, so independent revokes can overlap
+        with ThreadPoolExecutor(max_workers=min(MAX_REVOKE_WORKERS, len(rules))) as executor:
+            futures = {
+                executor.submit(
+                    self.ec2_client.revoke_security_group_ingress,
+                    GroupId=security_group_id,
+                    IpPermissions=[rule.aws_dict]
+                ): rule
+                for rule in rules
+            }
+            
+            for future in as_completed(futures):
+                rule = futures[future]
+                try:
+                    future.result()
+                    removed_count += 1
+                    logger.info(f"Removed rule: {rule.cidr_ip}:{rule.from_port}")
+                except Exception as e:
+                    failed_count += 1
+                    logger.error(f"Failed to remove rule {rule.cidr_ip}:{rule.from_port}: {str(e)}")
+        
+        return removed_count, failed_count
+    
     def remove_whitelist_rule_legacy(self, rule: SecurityGroupRule) -> WhitelistResult:
         """Remove IP whitelist rule from security group.
         
@@ -335,8 +588,9 @@ class AWSService:
         try:
             response = self.ec2_client.revoke_security_group_ingress(
                 GroupId=rule.group_id,
-                IpPermissions=[rule.to_aws_dict()]
+                IpPermissions=[rule.aws_dict]
             )
+            self.invalidate_security_group_cache(rule.group_id)
             
             return WhitelistResult(
                 success=True,
@@ -364,11 +618,12 @@ class AWSService:
                 error=f"Unexpected error: {str(e)}"
             )
     
-    def list_whitelist_rules(self, group_id: str) -> List[SecurityGroupRule]:
+    def list_whitelist_rules(self, group_id: str, fresh: bool = False) -> List[SecurityGroupRule]:
         """List all IP whitelist rules for a security group.
         
         Args:
             group_id: Security group ID
+            fresh: Skip the security group cache and always query EC2
         
         Returns:
             List of SecurityGroupRule objects
@@ -377,43 +632,22 @@ class AWSService:
             AWSServiceError: If listing fails
         """
         try:
-            sg = self.get_security_group(group_id)
+            sg = self.get_security_group(group_id, fresh=fresh)
             if not sg:
                 raise AWSServiceError(f"Security group {group_id} not found")
             
-            rules = []
-            
-            # Parse ingress rules
-            for permission in sg.get('IpPermissions', []):
-                protocol = permission.get('IpProtocol', 'tcp')
-                from_port = permission.get('FromPort', 0)
-                to_port = permission.get('ToPort', 0)
-                
-                # Handle IP ranges (IPv4)
-                for ip_range in permission.get('IpRanges', []):
-                    rule = SecurityGroupRule(
-                        group_id=group_id,
-                        ip_protocol=protocol,
-                        from_port=from_port,
-                        to_port=to_port,
-                        cidr_ip=ip_range['CidrIp'],
-                        description=ip_range.get('Description', '')
-                    )
-                    rules.append(rule)
-                
-                # Handle IPv6 ranges if needed
-                for ipv6_range in permission.get('Ipv6Ranges', []):
-                    rule = SecurityGroupRule(
-                        group_id=group_id,
-                        ip_protocol=protocol,
-                        from_port=from_port,
-                        to_port=to_port,
-                        cidr_ip=ipv6_range['CidrIpv6'],
-                        description=ipv6_range.get('Description', '')
-                    )
-                    rules.append(rule)
-            
-            return rules
+            return [
+                SecurityGroupRule(
+                    group_id=group_id,
+                    ip_protocol=protocol,
+                    from_port=from_port,
+                    to_port=to_port,
+                    cidr_ip=cidr,
+                    description=description
+                )
+                for protocol, from_port, to_port, cidr, description
+                in _iter_ip_ranges(sg.get('IpPermissions', []))
+            ]
             
         except AWSServiceError:
             raise
@@ -423,6 +657,9 @@ class AWSService:
     def check_rule_exists(self, rule: SecurityGroupRule) -> bool:
         """Check if a specific rule already exists in a security group.
         
+        This is a read-only probe; add_whitelist_rule does not need it since
+        EC2 rejects duplicate rules itself.
+        
         Args:
             rule: Security group rule to check
         
@@ -430,16 +667,20 @@ class AWSService:
             True if rule exists, False otherwise
         """
         try:
-            existing_rules = self.list_whitelist_rules(rule.group_id)
+            sg = self.get_security_group(rule.group_id)
+            if not sg:
+                return False
             
-            for existing in existing_rules:
-                if (existing.ip_protocol == rule.ip_protocol and
-                    existing.from_port == rule.from_port and
-                    existing.to_port == rule.to_port and
-                    existing.cidr_ip == rule.cidr_ip):
+            # Compare raw permissions rather than building a model per rule
+            permissions = sg.get('IpPermissions', [])
+            for protocol, from_port, to_port, cidr, _ in _iter_ip_ranges(permissions):
+                if (protocol == rule.ip_protocol and
+                    from_port == rule.from_port and
+                    to_port == rule.to_port and
+                    ipaddress.ip_network(cidr, strict=False) == rule.network):
                     return True
             
             return False
             
         except Exception:
-            return False
\ No newline at end of file
+            return False
@@ -1,27 +1,96 @@
 """Azure Network Security Group service for whitelisting operations."""
 
-from typing import List, Optional, Dict, Any, Union
+import hashlib
+import ipaddress
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Dict, Any, Set, Tuple, Union
 from dataclasses import dataclass
-from datetime import datetime
-
-from azure.identity import ClientSecretCredential, DefaultAzureCredential
-from azure.mgmt.network import NetworkManagementClient
-from azure.mgmt.network.models import (
-    NetworkSecurityGroup,
-    SecurityRule,
-    SecurityRuleProtocol,
-    SecurityRuleAccess,
-    SecurityRuleDirection
+from datetime import datetime, timezone
+
+from azure.core.exceptions import (
+    AzureError,
+    HttpResponseError,
+    ResourceNotFoundError,
+    ResourceNotModifiedError,
 )
-from azure.core.exceptions import AzureError, ResourceNotFoundError
 
-from whitelistmcp.utils.ip_validator import normalize_ip_input, IPValidationError
+# azure.identity and azure.mgmt.network are slow to load and only needed once
+# the service talks to Azure, so they are imported where they are used
+if TYPE_CHECKING:
+    from azure.mgmt.network import NetworkManagementClient
+    from azure.mgmt.network.models import NetworkSecurityGroup, SecurityRule
+
+from whitelistmcp.utils.cache import CredentialCache
+from whitelistmcp.utils.compat import DATACLASS_OPTIONS
+from whitelistmcp.utils.ip_validator import normalize_ip_input, ip_rule_name_part, IPValidationError
 from whitelistmcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds a fetched NSG is reused by read paths before fetching it again
+NSG_CACHE_TTL = 5.0
+
+# SecurityRule attributes kept in the on-disk NSG cache; everything the read
+# paths look at
+_CACHED_RULE_FIELDS = (
+    "name", "priority", "direction", "access", "protocol",
+    "source_address_prefix", "source_port_range",
+    "destination_address_prefix", "destination_port_range", "description"
+)
+
+# Upper bound on NSGs updated concurrently by add_whitelist_rule_multi
+MAX_NSG_WORKERS = 8
+
+# Attempts at a whole-NSG update before giving up on concurrent modifications
+NSG_UPDATE_ATTEMPTS = 3
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(ip: str) -> str:
+    return normalize_ip_input(ip)
+
+
+def _normalize_ip(ip: str) -> str:
+    """Normalize an IP or CIDR, caching everything except "current".
+    
+    Args:
+        ip: IP address, CIDR block, or "current"
+    
+    Returns:
+        Normalized CIDR block
+    
+    Raises:
+        IPValidationError: If input is invalid
+    """
+    # "current" resolves to whatever this machine's IP is right now
+    if ip.strip().lower() == "current":
+        return normalize_ip_input(ip)
+    return _normalize_cached(ip)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_prefix_cached(prefix: str) -> str:
+    try:
+        return normalize_ip_input(prefix)
+    except IPValidationError:
+        return prefix
+
+
+def _normalize_prefix(prefix: Optional[str]) -> Optional[str]:
+    """Normalize a rule's source prefix so "10.0.0.1" matches "10.0.0.1/32".
+    
+    Service tags such as "Internet" or "*" are returned unchanged, and are
+    cached like addresses. Rules without a single source prefix give None.
+    """
+    if prefix is None:
+        return None
+    return _normalize_prefix_cached(prefix)
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class AzureCredentials:
     """Azure credential information."""
     client_id: Optional[str] = None
@@ -31,7 +100,7 @@ class AzureCredentials:
     use_default_credential: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class NSGRule:
     """Azure Network Security Group rule representation."""
     nsg_name: str
@@ -48,7 +117,7 @@ class NSGRule:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class WhitelistResult:
     """Result of a whitelist operation."""
     success: bool
@@ -61,10 +130,16 @@ def create_rule_description(
     template: str,
     user: str = "MCP",
     reason: str = "Access",
-    service_name: Optional[str] = None
+    service_name: Optional[str] = None,
+    timestamp: Optional[str] = None
 ) -> str:
-    """Create a rule description from template."""
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M")
+    """Create a rule description from template.
+    
+    Callers describing several rules at once can pass a precomputed
+    timestamp instead of formatting the clock for each rule.
+    """
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M")
     description = template.format(
         user=user,
         reason=reason,
@@ -74,33 +149,136 @@ def create_rule_description(
     return description[:140]  # Azure limit is 140 characters
 
 
+def create_rule_name(source_address_prefix: str, port: Union[int, str]) -> str:
+    """Create the name of the rule allowing a source address to a port."""
+    return f"allow-{ip_rule_name_part(source_address_prefix)}-{port}"
+
+
+def create_rule_descriptions(
+    template: str,
+    count: int,
+    user: str = "MCP",
+    reason: str = "Access",
+    service_name: Optional[str] = None
+) -> List[str]:
+    """Create descriptions for rules added together in one batch.
+    
+    The template is formatted once, so every rule in the batch shares the
+    same timestamp.
+    """
+    return [create_rule_description(template, user, reason, service_name)] * count
+
+
+@lru_cache(maxsize=4096)
+def _network_bits(cidr: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """Parse a CIDR into (address bits, network as int, prefix length).
+    
+    Returns None for prefixes that are not CIDRs, such as service tags.
+    """
+    if cidr is None:
+        return None
+    try:
+        network = ipaddress.ip_network(cidr, strict=False)
+    except ValueError:
+        return None
+    return network.max_prefixlen, int(network.network_address), network.prefixlen
+
+
+def _cidr_contains(outer: Tuple[int, int, int], inner: Tuple[int, int, int]) -> bool:
+    """Check whether one parsed CIDR lies entirely within another."""
+    bits, network, prefix_len = outer
+    if bits != inner[0] or prefix_len > inner[2]:
+        return False
+    shift = bits - prefix_len
+    return inner[1] >> shift == network >> shift
+
+
+# Azure credentials keyed by a digest of the principal they authenticate
+_azure_credentials: CredentialCache[Any] = CredentialCache(max_entries=32)
+
+
+def _get_azure_credential(credentials: AzureCredentials) -> Any:
+    """Return a shared Azure credential for a service principal.
+    
+    Credentials cache their access tokens, so services built from the same
+    principal reuse one token instead of each requesting their own.
+    
+    Args:
+        credentials: Azure credentials; the service principal fields must be
+            set unless use_default_credential is
+    
+    Returns:
+        Azure token credential
+    
+    Raises:
+        ValueError: If the service principal fields are incomplete
+    """
+    # Imported on first use; azure.identity is slow to load
+    from azure.identity import ClientSecretCredential, DefaultAzureCredential
+    
+    if credentials.use_default_credential:
+        return _azure_credentials.get_or_create(DefaultAzureCredential, True)
+    
+    tenant_id = credentials.tenant_id
+    client_id = credentials.client_id
+    client_secret = credentials.client_secret
+    if not (tenant_id and client_id and client_secret):
+        raise ValueError("Azure credentials incomplete")
+    return _azure_credentials.get_or_create(
+        lambda: ClientSecretCredential(
+            tenant_id=tenant_id, client_id=client_id, client_secret=client_secret
+        ),
+        tenant_id,
+        client_id,
+        client_secret
+    )
+
+
+def _first_free_priority(used: Set[int]) -> int:
+    """Return the lowest free priority slot (100-3990, step 10)."""
+    # Walk used priorities in order; the first slot not taken before the
+    # walk passes it is the gap. Off-grid priorities (e.g. 105) are skipped
+    # over without consuming a slot.
+    expected = 100
+    for priority in sorted(used):
+        if priority == expected:
+            expected += 10
+        elif priority > expected:
+            break
+    if expected < 4000:
+        return expected
+    raise ValueError("No available priority slots in NSG")
+
+
 class AzureService:
     """Azure Network Security Group service."""
     
-    def __init__(self, credentials: AzureCredentials):
-        """Initialize Azure service with credentials."""
+    def __init__(self, credentials: AzureCredentials, disk_cache_dir: Optional[str] = None):
+        """Initialize Azure service with credentials.
+        
+        Args:
+            credentials: Azure credentials
+            disk_cache_dir: Directory for NSG snapshots that survive restarts;
+                disabled when None
+        """
         self.credentials = credentials
+        self.disk_cache_dir = disk_cache_dir
         self._client = None
+        # (resource group, NSG name) -> (fetched at, NSG)
+        self._nsg_cache: Dict[Tuple[str, str], Tuple[float, "NetworkSecurityGroup"]] = {}
+        # (resource group, NSG name) -> (NSG indexed, {(source prefix, protocol): ports})
+        self._nsg_rule_index: Dict[
+            Tuple[str, str],
+            Tuple["NetworkSecurityGroup", Dict[Tuple[str, str], Set[str]]]
+        ] = {}
         
     @property
-    def client(self) -> NetworkManagementClient:
+    def client(self) -> "NetworkManagementClient":
         """Get or create Azure Network Management client."""
         if self._client is None:
-            if self.credentials.use_default_credential:
-                credential = DefaultAzureCredential()
-            else:
-                if not all([
-                    self.credentials.client_id,
-                    self.credentials.client_secret,
-                    self.credentials.tenant_id
-                ]):
-                    raise ValueError("Azure credentials incomplete")
-                    
-                credential = ClientSecretCredential(
-                    tenant_id=self.credentials.tenant_id,
-                    client_id=self.credentials.client_id,
-                    client_secret=self.credentials.client_secret
-                )
+            from azure.mgmt.network import NetworkManagementClient
+            
+            credential = _get_azure_credential(self.credentials)
             
             self._client = NetworkManagementClient(
                 credential=credential,
@@ -109,88 +287,382 @@ class AzureService:
             
         return self._client
     
-    def _get_next_priority(self, nsg: NetworkSecurityGroup, direction: str = "Inbound") -> int:
+    def _get_next_priority(self, nsg: "NetworkSecurityGroup", direction: str = "Inbound") -> int:
         """Get the next available priority for a new rule."""
-        if not nsg.security_rules:
-            return 100
-            
-        priorities = [
-            rule.priority for rule in nsg.security_rules
-            if rule.direction == direction and rule.priority < 4000
-        ]
-        
-        if not priorities:
-            return 100
-            
-        # Find gap in priorities
-        priorities.sort()
-        for i in range(100, 4000, 10):
-            if i not in priorities:
-                return i
-                
-        raise ValueError("No available priority slots in NSG")
+        used = {
+            rule.priority for rule in (nsg.security_rules or [])
+            if rule.direction == direction
+        }
+        return _first_free_priority(used)
     
-    def add_whitelist_rule(self, rule: NSGRule) -> WhitelistResult:
-        """Add a whitelist rule to an NSG."""
+    def _get_nsg(
+        self,
+        resource_group: str,
+        nsg_name: str,
+        max_age: float = NSG_CACHE_TTL
+    ) -> "NetworkSecurityGroup":
+        """Fetch an NSG, reusing a copy fetched within the last max_age seconds."""
+        key = (resource_group, nsg_name)
+        cached = self._nsg_cache.get(key)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        
+        # Read paths revalidate a snapshot from disk with a conditional GET;
+        # writes always take the full NSG since they PUT it back
+        cache_dir = self.disk_cache_dir
+        snapshot = None
+        if cache_dir and max_age > 0:
+            snapshot = self._load_nsg_snapshot(cache_dir, resource_group, nsg_name)
+        request_options: Dict[str, Any] = {}
+        if snapshot:
+            request_options["headers"] = {"If-None-Match": snapshot[0]}
+        
         try:
-            # Get the NSG
             nsg = self.client.network_security_groups.get(
-                resource_group_name=rule.resource_group,
-                network_security_group_name=rule.nsg_name
+                resource_group_name=resource_group,
+                network_security_group_name=nsg_name,
+                **request_options
             )
-            
-            # Auto-assign priority if not set
+        except ResourceNotModifiedError:
+            if snapshot is None:
+                raise
+            nsg = snapshot[1]
+        else:
+            if cache_dir:
+                self._store_nsg_snapshot(cache_dir, resource_group, nsg_name, nsg)
+        
+        self._nsg_cache[key] = (time.monotonic(), nsg)
+        return nsg
+    
+    def _snapshot_path(self, cache_dir: str, resource_group: str, nsg_name: str) -> str:
+        """Path of the on-disk snapshot for an NSG."""
+        key = f"{self.credentials.subscription_id}/{resource_group}/{nsg_name}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(cache_dir, f"nsg-{digest}.json")
+    
+    def _load_nsg_snapshot(
+        self,
+        cache_dir: str,
+        resource_group: str,
+        nsg_name: str
+    ) -> Optional[Tuple[str, "NetworkSecurityGroup"]]:
+        """Load an NSG snapshot and its etag, or None if there is no usable one."""
+        from azure.mgmt.network.models import NetworkSecurityGroup, SecurityRule
+        
+        try:
+            path = self._snapshot_path(cache_dir, resource_group, nsg_name)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            nsg = NetworkSecurityGroup(location=data.get("location"))
+            nsg.security_rules = [SecurityRule(**rule) for rule in data["security_rules"]]
+            return data["etag"], nsg
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _store_nsg_snapshot(
+        self,
+        cache_dir: str,
+        resource_group: str,
+        nsg_name: str,
+        nsg: "NetworkSecurityGroup"
+    ) -> None:
+        """Save the rule fields of an NSG with its etag; failures are ignored."""
+        if not nsg.etag:
+            return
+        
+        data = {
+            "etag": nsg.etag,
+            "location": nsg.location,
+            "security_rules": [
+                {field: getattr(rule, field) for field in _CACHED_RULE_FIELDS}
+                for rule in nsg.security_rules or []
+            ]
+        }
+        path = self._snapshot_path(cache_dir, resource_group, nsg_name)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write NSG snapshot %s: %s", path, e)
+    
+    def _invalidate_nsg(self, resource_group: str, nsg_name: str) -> None:
+        """Drop a cached NSG after it has been modified."""
+        self._nsg_cache.pop((resource_group, nsg_name), None)
+        self._nsg_rule_index.pop((resource_group, nsg_name), None)
+    
+    def _get_rule_index(
+        self,
+        resource_group: str,
+        nsg_name: str
+    ) -> Dict[Tuple[str, str], Set[str]]:
+        """Index an NSG's inbound allow rules by (source prefix, protocol).
+        
+        The index is rebuilt only when a different NSG object is fetched, so
+        it follows the NSG cache.
+        """
+        nsg = self._get_nsg(resource_group, nsg_name)
+        key = (resource_group, nsg_name)
+        cached = self._nsg_rule_index.get(key)
+        if cached is not None and cached[0] is nsg:
+            return cached[1]
+        
+        index: Dict[Tuple[str, str], Set[str]] = {}
+        for rule in nsg.security_rules or []:
+            if rule.direction != "Inbound" or rule.access != "Allow":
+                continue
+            # Rules listing several prefixes in source_address_prefixes have none here
+            prefix = _normalize_prefix(rule.source_address_prefix)
+            if prefix is None:
+                continue
+            ports = index.setdefault((prefix, rule.protocol.lower()), set())
+            ports.add(rule.destination_port_range)
+        self._nsg_rule_index[key] = (nsg, index)
+        return index
+    
+    def _to_security_rule(self, rule: NSGRule) -> "SecurityRule":
+        """Build the Azure SDK model for a rule.
+        
+        A generated name is written back to the rule so the caller's rule
+        and the result agree on it.
+        """
+        from azure.mgmt.network.models import SecurityRule
+        
+        name = rule.name
+        if not name:
+            name = create_rule_name(rule.source_address_prefix, rule.destination_port_range)
+            rule.name = name
+        return SecurityRule(
+            name=name,
+            priority=rule.priority,
+            direction=rule.direction,
+            access=rule.access,
+            protocol=rule.protocol,
+            source_address_prefix=rule.source_address_prefix,
+            source_port_range=rule.source_port_range,
+            destination_address_prefix=rule.destination_address_prefix,
+            destination_port_range=rule.destination_port_range,
+            description=rule.description
+        )
+    
+    def _assign_priorities(
+        self,
+        nsg: "NetworkSecurityGroup",
+        rules: List[NSGRule],
+        security_rules: List["SecurityRule"]
+    ) -> List["SecurityRule"]:
+        """Give rules without a priority the next free slots in an NSG.
+        
+        Existing rules with the same name as a new rule are replaced, so their
+        slots count as free.
+        
+        Returns:
+            The NSG's existing rules that are kept alongside the new ones
+        """
+        new_names = {security_rule.name for security_rule in security_rules}
+        kept_rules = [r for r in (nsg.security_rules or []) if r.name not in new_names]
+        
+        # Track slots used per direction
+        used: Dict[str, Set[int]] = {}
+        for existing in kept_rules:
+            used.setdefault(existing.direction, set()).add(existing.priority)
+        for rule, security_rule in zip(rules, security_rules):
+            taken = used.setdefault(rule.direction, set())
             if rule.priority == 0:
-                rule.priority = self._get_next_priority(nsg, rule.direction)
+                rule.priority = _first_free_priority(taken)
+                security_rule.priority = rule.priority
+            taken.add(rule.priority)
+        return kept_rules
+    
+    def _add_rules(
+        self,
+        rules: List[NSGRule],
+        write: Callable[[List[NSGRule]], None]
+    ) -> List[WhitelistResult]:
+        """Run an add operation for rules in one NSG and report per-rule results."""
+        nsg_name = rules[0].nsg_name
+        resource_group = rules[0].resource_group
+        try:
+            write(rules)
             
-            # Create the security rule
-            security_rule = SecurityRule(
-                name=rule.name or f"rule-{rule.source_address_prefix.replace('/', '-')}-{rule.destination_port_range}",
-                priority=rule.priority,
-                direction=rule.direction,
-                access=rule.access,
-                protocol=rule.protocol,
-                source_address_prefix=rule.source_address_prefix,
-                source_port_range=rule.source_port_range,
-                destination_address_prefix=rule.destination_address_prefix,
-                destination_port_range=rule.destination_port_range,
-                description=rule.description
-            )
+            for rule in rules:
+                logger.info(
+                    "Added rule to NSG %s: %s -> %s",
+                    nsg_name, rule.source_address_prefix, rule.destination_port_range
+                )
             
-            # Create or update the rule
-            operation = self.client.security_rules.begin_create_or_update(
-                resource_group_name=rule.resource_group,
-                network_security_group_name=rule.nsg_name,
-                security_rule_name=security_rule.name,
-                security_rule_parameters=security_rule
-            )
+            return [
+                WhitelistResult(
+                    success=True,
+                    message=f"Successfully added rule to NSG {nsg_name}",
+                    rule=rule
+                )
+                for rule in rules
+            ]
             
-            result = operation.result()
+        except ResourceNotFoundError:
+            return [
+                WhitelistResult(
+                    success=False,
+                    message=f"NSG {nsg_name} not found in resource group {resource_group}",
+                    error="NSG_NOT_FOUND"
+                )
+                for _ in rules
+            ]
+        except (AzureError, ValueError) as e:
+            # ValueError: incomplete credentials, or no free priority slot left
+            logger.error("Failed to add rule: %s", e)
+            return [
+                WhitelistResult(
+                    success=False,
+                    message="Failed to add rule",
+                    error=str(e)
+                )
+                for _ in rules
+            ]
+        finally:
+            self._invalidate_nsg(resource_group, nsg_name)
+    
+    def _put_security_rule(self, rules: List[NSGRule]) -> None:
+        """Write a single rule with its own security rule operation."""
+        rule = rules[0]
+        # Fetch fresh so the auto-assigned priority reflects the current NSG
+        nsg = self._get_nsg(rule.resource_group, rule.nsg_name, max_age=0)
+        security_rule = self._to_security_rule(rule)
+        self._assign_priorities(nsg, rules, [security_rule])
+        
+        self.client.security_rules.begin_create_or_update(
+            resource_group_name=rule.resource_group,
+            network_security_group_name=rule.nsg_name,
+            security_rule_name=rule.name,
+            security_rule_parameters=security_rule
+        ).result()
+    
+    def _put_nsg_rules(self, rules: List[NSGRule]) -> None:
+        """Write rules by updating the whole NSG, guarded by its etag.
+        
+        The PUT is conditional on the etag of the NSG it was built from, so a
+        concurrent change to the NSG fails it with 412 instead of being
+        overwritten; the NSG is then fetched again and the update rebuilt.
+        """
+        from azure.mgmt.network.models import NetworkSecurityGroup
+        
+        nsg_name = rules[0].nsg_name
+        resource_group = rules[0].resource_group
+        requested_priorities = [rule.priority for rule in rules]
+        
+        for attempt in range(1, NSG_UPDATE_ATTEMPTS + 1):
+            # Always fetch fresh: the rule list is written back as a whole
+            nsg = self._get_nsg(resource_group, nsg_name, max_age=0)
             
-            logger.info(
-                f"Added rule to NSG {rule.nsg_name}: "
-                f"{rule.source_address_prefix} -> {rule.destination_port_range}"
-            )
+            # Priorities assigned on an earlier attempt may now be taken
+            for rule, priority in zip(rules, requested_priorities):
+                rule.priority = priority
+            new_rules = [self._to_security_rule(rule) for rule in rules]
             
-            return WhitelistResult(
-                success=True,
-                message=f"Successfully added rule to NSG {rule.nsg_name}",
-                rule=rule
-            )
+            # The fetched NSG is shared with concurrent readers through the
+            # cache, so the update is built on a separate model
+            body = NetworkSecurityGroup(location=nsg.location, tags=nsg.tags)
+            body.etag = nsg.etag
+            body.security_rules = self._assign_priorities(nsg, rules, new_rules) + new_rules
             
-        except ResourceNotFoundError:
-            return WhitelistResult(
-                success=False,
-                message=f"NSG {rule.nsg_name} not found in resource group {rule.resource_group}",
-                error="NSG_NOT_FOUND"
-            )
-        except Exception as e:
-            logger.error(f"Failed to add rule: {str(e)}")
-            return WhitelistResult(
-                success=False,
-                message="Failed to add rule",
-                error=str(e)
-            )
+            request_options: Dict[str, Any] = {}
+            if nsg.etag:
+                request_options["headers"] = {"If-Match": nsg.etag}
+            try:
+                self.client.network_security_groups.begin_create_or_update(
+                    resource_group_name=resource_group,
+                    network_security_group_name=nsg_name,
+                    parameters=body,
+                    **request_options
+                ).result()
+                return
+            except HttpResponseError as e:
+                if e.status_code != 412 or attempt == NSG_UPDATE_ATTEMPTS:
+                    raise
+                logger.info(
+                    "NSG %s changed during update, retrying (attempt %d)", nsg_name, attempt
+                )
+    
+    def add_whitelist_rule(self, rule: NSGRule) -> WhitelistResult:
+        """Add a whitelist rule to an NSG.
+        
+        The rule is written with its own security rule operation, so the rest
+        of the NSG is never rewritten. A rule with the same name is replaced.
+        """
+        return self._add_rules([rule], self._put_security_rule)[0]
+    
+    def add_whitelist_rules(self, rules: List[NSGRule]) -> List[WhitelistResult]:
+        """Add whitelist rules to an NSG with a single NSG update.
+        
+        The NSG is fetched once, rules without a priority are given the next
+        free slots, and the combined rule set is written back in one PUT rather
+        than one security rule operation per rule, which Azure serializes per
+        NSG. The PUT only succeeds if the NSG is unchanged since it was read;
+        otherwise it is rebuilt from a fresh copy and retried. A new rule
+        replaces an existing rule of the same name.
+        
+        Args:
+            rules: Rules to add; all must target the same NSG
+        
+        Returns:
+            One WhitelistResult per rule, in input order
+        
+        Raises:
+            ValueError: If the rules target different NSGs
+        """
+        if not rules:
+            return []
+        
+        nsg_name = rules[0].nsg_name
+        resource_group = rules[0].resource_group
+        if any(r.nsg_name != nsg_name or r.resource_group != resource_group for r in rules):
+            raise ValueError("All rules in a batch must target the same NSG")
+        
+        return self._add_rules(rules, self._put_nsg_rules)
+    
+    def add_whitelist_rule_multi(self, rules: List[NSGRule]) -> List[WhitelistResult]:
+        """Add whitelist rules that may span several NSGs.
+        
+        Rules are grouped per NSG; each group is written with one
+        add_whitelist_rules call and distinct NSGs are updated concurrently.
+        A group that raises fails on its own, so results for NSGs that were
+        written are still reported.
+        
+        Args:
+            rules: Rules to add, in any NSG
+        
+        Returns:
+            One WhitelistResult per rule, in input order
+        """
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for i, rule in enumerate(rules):
+            groups.setdefault((rule.resource_group, rule.nsg_name), []).append(i)
+        
+        if len(groups) <= 1:
+            return self.add_whitelist_rules(rules)
+        
+        def add_group(indexes: List[int]) -> List[WhitelistResult]:
+            group = [rules[i] for i in indexes]
+            try:
+                return self.add_whitelist_rules(group)
+            except Exception as e:
+                logger.error("Failed to add rules to NSG %s: %s", group[0].nsg_name, e)
+                return [
+                    WhitelistResult(success=False, message="Failed to add rule", error=str(e))
+                    for _ in group
+                ]
+        
+        # Azure serializes updates per NSG, but separate NSGs can be written in parallel
+        with ThreadPoolExecutor(max_workers=min(MAX_NSG_WORKERS, len(groups))) as executor:
+            group_results = list(executor.map(add_group, groups.values()))
+        
+        results: Dict[int, WhitelistResult] = {}
+        for indexes, group_result in zip(groups.values(), group_results):
+            results.update(zip(indexes, group_result))
+        return [results[i] for i in range(len(rules))]
     
     def remove_whitelist_rule(
         self,
@@ -203,11 +675,9 @@ class AzureService:
     ) -> WhitelistResult:
         """Remove whitelist rules based on flexible criteria."""
         try:
-            # Get the NSG
-            nsg = self.client.network_security_groups.get(
-                resource_group_name=resource_group,
-                network_security_group_name=nsg_name
-            )
+            # Match against a fresh NSG; a cached one may miss rules added by
+            # another writer within the cache TTL
+            nsg = self._get_nsg(resource_group, nsg_name, max_age=0)
             
             if not nsg.security_rules:
                 return WhitelistResult(
@@ -219,7 +689,7 @@ class AzureService:
             # Normalize IP if provided
             if ip_address:
                 try:
-                    ip_address = normalize_ip_input(ip_address)
+                    ip_address = _normalize_ip(ip_address)
                 except IPValidationError:
                     return WhitelistResult(
                         success=False,
@@ -230,31 +700,21 @@ class AzureService:
             # Convert port to string for comparison
             port_str = str(port) if port else None
             
-            # Find rules to remove
-            rules_to_remove = []
-            for rule in nsg.security_rules:
-                match = True
-                
-                # Check IP match
-                if ip_address and rule.source_address_prefix != ip_address:
-                    match = False
-                
-                # Check port match
-                if port_str and rule.destination_port_range != port_str:
-                    match = False
-                
-                # Check service name match (in description)
-                if service_name and (not rule.description or service_name not in rule.description):
-                    match = False
-                
-                # Check protocol match
-                if protocol and rule.protocol.lower() != protocol.lower():
-                    match = False
-                
-                if match:
-                    rules_to_remove.append(rule)
+            # Find rules to remove; cheapest equality checks first, then the
+            # case-insensitive protocol and description substring checks.
+            # SDK model attributes resolve through descriptors, so each filter
+            # reads its attribute only once the filters before it have passed.
+            protocol_lower = protocol.lower() if protocol else None
+            names_to_remove: List[str] = [
+                rule.name for rule in nsg.security_rules
+                if rule.name
+                and (not ip_address or _normalize_prefix(rule.source_address_prefix) == ip_address)
+                and (not port_str or rule.destination_port_range == port_str)
+                and (not protocol_lower or rule.protocol.lower() == protocol_lower)
+                and (not service_name or service_name in (rule.description or ""))
+            ]
             
-            if not rules_to_remove:
+            if not names_to_remove:
                 criteria = []
                 if ip_address:
                     criteria.append(f"IP={ip_address}")
@@ -269,64 +729,76 @@ class AzureService:
                     error="NO_MATCHING_RULES"
                 )
             
-            # Remove the rules
-            removed_count = 0
-            for rule in rules_to_remove:
+            # Start every delete before waiting on any, so the long-running
+            # operations progress on the service side concurrently
+            pollers = []
+            for name in names_to_remove:
                 try:
-                    self.client.security_rules.begin_delete(
+                    pollers.append((name, self.client.security_rules.begin_delete(
                         resource_group_name=resource_group,
                         network_security_group_name=nsg_name,
-                        security_rule_name=rule.name
-                    ).result()
+                        security_rule_name=name
+                    )))
+                except AzureError as e:
+                    logger.error("Failed to remove rule %s: %s", name, e)
+            
+            removed_count = 0
+            for name, poller in pollers:
+                try:
+                    poller.result()
                     removed_count += 1
-                    logger.info(f"Removed rule {rule.name} from NSG {nsg_name}")
-                except Exception as e:
-                    logger.error(f"Failed to remove rule {rule.name}: {str(e)}")
+                    logger.info("Removed rule %s from NSG %s", name, nsg_name)
+                except AzureError as e:
+                    logger.error("Failed to remove rule %s: %s", name, e)
             
             return WhitelistResult(
                 success=True,
                 message=f"Successfully removed {removed_count} rule(s) from NSG {nsg_name}"
             )
             
-        except Exception as e:
-            logger.error(f"Failed to remove rules: {str(e)}")
+        except (AzureError, ValueError) as e:
+            # ValueError: incomplete credentials
+            logger.error("Failed to remove rules: %s", e)
             return WhitelistResult(
                 success=False,
                 message="Failed to remove rules",
                 error=str(e)
             )
+        finally:
+            self._invalidate_nsg(resource_group, nsg_name)
+    
+    def iter_whitelist_rules(self, nsg_name: str, resource_group: str) -> Iterator[NSGRule]:
+        """Yield the whitelist rules in an NSG one at a time.
+        
+        Unlike list_whitelist_rules, errors fetching the NSG are raised to the
+        caller when iteration starts.
+        """
+        nsg = self._get_nsg(resource_group, nsg_name)
+        
+        for rule in nsg.security_rules or []:
+            if rule.direction == "Inbound" and rule.access == "Allow":
+                yield NSGRule(
+                    nsg_name=nsg_name,
+                    resource_group=resource_group,
+                    name=rule.name,
+                    priority=rule.priority,
+                    direction=rule.direction,
+                    access=rule.access,
+                    protocol=rule.protocol,
+                    source_address_prefix=rule.source_address_prefix,
+                    source_port_range=rule.source_port_range,
+                    destination_address_prefix=rule.destination_address_prefix,
+                    destination_port_range=rule.destination_port_range,
+                    description=rule.description
+                )
     
     def list_whitelist_rules(self, nsg_name: str, resource_group: str) -> List[NSGRule]:
         """List all whitelist rules in an NSG."""
         try:
-            nsg = self.client.network_security_groups.get(
-                resource_group_name=resource_group,
-                network_security_group_name=nsg_name
-            )
-            
-            rules = []
-            if nsg.security_rules:
-                for rule in nsg.security_rules:
-                    if rule.direction == "Inbound" and rule.access == "Allow":
-                        rules.append(NSGRule(
-                            nsg_name=nsg_name,
-                            resource_group=resource_group,
-                            name=rule.name,
-                            priority=rule.priority,
-                            direction=rule.direction,
-                            access=rule.access,
-                            protocol=rule.protocol,
-                            source_address_prefix=rule.source_address_prefix,
-                            source_port_range=rule.source_port_range,
-                            destination_address_prefix=rule.destination_address_prefix,
-                            destination_port_range=rule.destination_port_range,
-                            description=rule.description
-                        ))
-            
-            return rules
+            return list(self.iter_whitelist_rules(nsg_name, resource_group))
             
         except Exception as e:
-            logger.error(f"Failed to list rules: {str(e)}")
+            logger.error("Failed to list rules: %s", e)
             return []
     
     def check_whitelist_rule(
@@ -337,30 +809,35 @@ class AzureService:
         port: Optional[Union[int, str]] = None,
         protocol: str = "Tcp"
     ) -> bool:
-        """Check if an IP/port combination is whitelisted."""
+        """Check if an IP/port combination is whitelisted.
+        
+        An address is whitelisted by a rule for the same protocol whose
+        source prefix equals or contains it, e.g. 10.0.0.5 by 10.0.0.0/24.
+        """
         try:
-            ip_address = normalize_ip_input(ip_address)
-            rules = self.list_whitelist_rules(nsg_name, resource_group)
+            ip_address = _normalize_ip(ip_address)
+            index = self._get_rule_index(resource_group, nsg_name)
             
+            protocol = protocol.lower()
+            # Any port matches when none is specified
             port_str = str(port) if port else None
             
-            for rule in rules:
-                # Check IP match
-                if rule.source_address_prefix != ip_address:
-                    continue
-                
-                # Check port match if specified
-                if port_str and rule.destination_port_range != port_str:
-                    continue
-                
-                # Check protocol match
-                if rule.protocol.lower() != protocol.lower():
-                    continue
-                
+            ports = index.get((ip_address, protocol))
+            if ports and (port_str is None or port_str in ports):
                 return True
             
+            # Otherwise look for a wider rule prefix containing the address
+            query = _network_bits(ip_address)
+            if query is None:
+                return False
+            for (prefix, rule_protocol), ports in index.items():
+                if rule_protocol != protocol or (port_str is not None and port_str not in ports):
+                    continue
+                network = _network_bits(prefix)
+                if network is not None and _cidr_contains(network, query):
+                    return True
             return False
             
         except Exception as e:
-            logger.error(f"Failed to check rule: {str(e)}")
+            logger.error("Failed to check rule: %s", e)
             return False
\ No newline at end of file
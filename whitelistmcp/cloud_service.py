@@ -1,33 +1,58 @@
 """Unified cloud service interface for multi-cloud whitelisting operations."""
 
-from typing import List, Optional, Dict, Any, Union
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Dict, Any, Tuple, TypeVar, Union, cast
+from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from whitelistmcp.config import CloudProvider, Config
+from whitelistmcp.utils.cache import credentials_digest
+from whitelistmcp.utils.compat import DATACLASS_OPTIONS
+from whitelistmcp.utils.ip_validator import ip_rule_name_part, normalize_ip_input
 from whitelistmcp.utils.logging import get_logger
 
 # Import cloud-specific services
 from whitelistmcp.aws.service import (
     AWSService, 
     AWSCredentials, 
-    SecurityGroupRule as AWSRule
+    SecurityGroupRule as AWSRule,
+    create_rule_description as _aws_rule_description
 )
 from whitelistmcp.azure.service import (
     AzureService,
     AzureCredentials,
-    NSGRule as AzureRule
+    NSGRule as AzureRule,
+    create_rule_description as _azure_rule_description,
+    create_rule_descriptions as _azure_rule_descriptions,
+    create_rule_name as _azure_rule_name
 )
 from whitelistmcp.gcp.service import (
     GCPService,
     GCPCredentials,
-    FirewallRule as GCPRule
+    FirewallRule as GCPRule,
+    create_rule_description as _gcp_rule_description
 )
 
 logger = get_logger(__name__)
 
+# Worker threads shared by all fan-out calls. The work is network I/O, so
+# the pool is sized for concurrent requests rather than CPU count alone;
+# threads are only started as tasks arrive.
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 5)
 
-@dataclass
+# Seconds a cloud service (and its SDK client and credentials) is reused
+# before being rebuilt, so rotated tokens and keys are picked up
+SERVICE_CACHE_TTL = 1800.0
+
+# Most cloud services kept at once; the least recently used are dropped first
+SERVICE_CACHE_MAX_ENTRIES = 32
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class CloudCredentials:
     """Unified cloud credentials container."""
     cloud: CloudProvider
@@ -36,7 +61,7 @@ class CloudCredentials:
     gcp_credentials: Optional[GCPCredentials] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class UnifiedWhitelistResult:
     """Result from multi-cloud whitelist operation."""
     cloud: CloudProvider
@@ -46,25 +71,185 @@ class UnifiedWhitelistResult:
     error: Optional[str] = None
 
 
+# A per-cloud operation for _run_tasks: (cloud, operation, arguments)
+_CloudTask = Tuple[CloudProvider, Callable[..., Any], Tuple[Any, ...]]
+
+# A cloud service kept by CloudServiceManager._cached_service
+_Service = TypeVar("_Service")
+
+
+def _raise_timeout(timeout: float) -> None:
+    raise TimeoutError(f"No response within {timeout:g}s")
+
+
 class CloudServiceManager:
     """Manages whitelisting operations across multiple cloud providers."""
     
-    def __init__(self, config: Config):
-        """Initialize cloud service manager."""
+    def __init__(self, config: Config, max_workers: Optional[int] = None):
+        """Initialize cloud service manager.
+        
+        Args:
+            config: Server configuration
+            max_workers: Threads shared by concurrent cloud operations;
+                defaults to DEFAULT_MAX_WORKERS
+        """
         self.config = config
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or DEFAULT_MAX_WORKERS)
+        # (cloud, credentials digest) -> (created at, service), in LRU order
+        self._service_cache: "OrderedDict[Tuple[CloudProvider, str], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._service_lock = threading.Lock()
+    
+    def _cached_service(
+        self,
+        key: Tuple[CloudProvider, str],
+        factory: Callable[[], _Service]
+    ) -> _Service:
+        """Return the cached service for key, building it if missing or expired.
+        
+        The service is built outside the lock, so a slow construction does
+        not hold up lookups for other clouds and credentials. Expired services
+        are purged whenever one is added, and the cache keeps at most
+        SERVICE_CACHE_MAX_ENTRIES, dropping the least recently used.
+        """
+        with self._service_lock:
+            cached = self._service_cache.get(key)
+            if cached and time.monotonic() - cached[0] < SERVICE_CACHE_TTL:
+                self._service_cache.move_to_end(key)
+                return cast(_Service, cached[1])
+        
+        service = factory()
+        with self._service_lock:
+            now = time.monotonic()
+            # Another thread may have stored a service while this one was built
+            cached = self._service_cache.get(key)
+            if cached and now - cached[0] < SERVICE_CACHE_TTL:
+                self._service_cache.move_to_end(key)
+                return cast(_Service, cached[1])
+            
+            expired = [
+                k for k, (created, _) in self._service_cache.items()
+                if now - created >= SERVICE_CACHE_TTL
+            ]
+            for expired_key in expired:
+                del self._service_cache[expired_key]
+            self._service_cache[key] = (now, service)
+            while len(self._service_cache) > SERVICE_CACHE_MAX_ENTRIES:
+                self._service_cache.popitem(last=False)
+            return service
     
     def _get_aws_service(self, credentials: AWSCredentials) -> AWSService:
         """Get AWS service instance."""
-        return AWSService(credentials)
+        key = (CloudProvider.AWS, credentials_digest(
+            credentials.access_key_id,
+            credentials.secret_access_key,
+            credentials.session_token,
+            credentials.region
+        ))
+        return self._cached_service(key, lambda: AWSService(credentials))
     
     def _get_azure_service(self, credentials: AzureCredentials) -> AzureService:
         """Get Azure service instance."""
-        return AzureService(credentials)
+        disk_cache_dir = self.config.default_parameters.azure_nsg_cache_dir
+        key = (CloudProvider.AZURE, credentials_digest(
+            credentials.tenant_id,
+            credentials.client_id,
+            credentials.client_secret,
+            credentials.subscription_id,
+            credentials.use_default_credential,
+            disk_cache_dir
+        ))
+        return self._cached_service(
+            key, lambda: AzureService(credentials, disk_cache_dir=disk_cache_dir)
+        )
     
     def _get_gcp_service(self, credentials: GCPCredentials) -> GCPService:
         """Get GCP service instance."""
-        return GCPService(credentials, additive_only=self.config.default_parameters.gcp_additive_only)
+        additive_only = self.config.default_parameters.gcp_additive_only
+        key = (CloudProvider.GCP, credentials_digest(
+            credentials.project_id,
+            credentials.credentials_path,
+            credentials.credentials_json,
+            credentials.use_default_credential,
+            additive_only
+        ))
+        return self._cached_service(
+            key, lambda: GCPService(credentials, additive_only=additive_only)
+        )
+    
+    def _select_clouds(self, credentials: CloudCredentials) -> List[CloudProvider]:
+        """Determine which clouds an operation targets."""
+        if credentials.cloud != CloudProvider.ALL:
+            return [credentials.cloud]
+        
+        clouds = []
+        if credentials.aws_credentials:
+            clouds.append(CloudProvider.AWS)
+        if credentials.azure_credentials:
+            clouds.append(CloudProvider.AZURE)
+        if credentials.gcp_credentials:
+            clouds.append(CloudProvider.GCP)
+        return clouds
+    
+    def _run_tasks(
+        self,
+        tasks: List[_CloudTask],
+        action: str
+    ) -> List[UnifiedWhitelistResult]:
+        """Run per-cloud operations and gather their results.
+        
+        A single operation, the usual single-cloud case, runs on the calling
+        thread; several run concurrently on the shared executor, and any
+        still running after the configured cloud_timeout are reported as
+        failed.
+        
+        Args:
+            tasks: (cloud, operation, arguments) for each operation
+            action: Describes the operation in failure messages, e.g. "add rule to"
+        
+        Returns:
+            Results in task order; an operation may return one result or a list
+        """
+        calls: List[Tuple[CloudProvider, Callable[[], Any]]]
+        if len(tasks) == 1:
+            cloud, operation, args = tasks[0]
+            calls = [(cloud, functools.partial(operation, *args))]
+        else:
+            futures = [
+                (cloud, self.executor.submit(operation, *args))
+                for cloud, operation, args in tasks
+            ]
+            # A hung cloud is reported as failed rather than holding up the
+            # others; its thread cannot be interrupted and finishes on its own
+            timeout = self.config.default_parameters.cloud_timeout
+            done, _ = wait([future for _, future in futures], timeout=timeout)
+            calls = []
+            for cloud, future in futures:
+                if future in done:
+                    calls.append((cloud, future.result))
+                else:
+                    future.cancel()
+                    calls.append((cloud, functools.partial(_raise_timeout, timeout)))
+        
+        results = []
+        for cloud, get_result in calls:
+            try:
+                result = get_result()
+                if isinstance(result, list):
+                    results.extend(result)
+                else:
+                    results.append(result)
+            except Exception as e:
+                logger.error("Failed to %s %s: %s", action, cloud, e)
+                results.append(UnifiedWhitelistResult(
+                    cloud=cloud,
+                    success=False,
+                    message=f"Failed to {action} {cloud}",
+                    error=str(e)
+                ))
+        
+        return results
     
     def add_whitelist_rule(
         self,
@@ -78,83 +263,142 @@ class CloudServiceManager:
         resource_group: Optional[str] = None  # For Azure
     ) -> List[UnifiedWhitelistResult]:
         """Add whitelist rule to specified cloud(s)."""
-        results = []
-        
-        # Use default port if not specified
+        # Resolve defaults once rather than in each cloud branch
+        defaults = self.config.default_parameters
         if port is None:
-            port = self.config.default_parameters.port
+            port = defaults.port
+        resource_group = resource_group or defaults.azure_resource_group
         
-        # Determine which clouds to target
-        clouds = []
-        if credentials.cloud == CloudProvider.ALL:
-            if credentials.aws_credentials:
-                clouds.append(CloudProvider.AWS)
-            if credentials.azure_credentials:
-                clouds.append(CloudProvider.AZURE)
-            if credentials.gcp_credentials:
-                clouds.append(CloudProvider.GCP)
-        else:
-            clouds.append(credentials.cloud)
-        
-        # Execute operations in parallel
-        futures = {}
+        clouds = self._select_clouds(credentials)
         
+        # Each task is (cloud, operation, arguments)
+        tasks: List[_CloudTask] = []
         for cloud in clouds:
             if cloud == CloudProvider.AWS and credentials.aws_credentials:
-                future = self.executor.submit(
+                tasks.append((
+                    CloudProvider.AWS,
                     self._add_aws_rule,
-                    credentials.aws_credentials,
-                    target,
-                    ip_address,
-                    port,
-                    protocol,
-                    description,
-                    service_name
-                )
-                futures[future] = CloudProvider.AWS
+                    (
+                        credentials.aws_credentials,
+                        target,
+                        ip_address,
+                        port,
+                        protocol,
+                        description,
+                        service_name
+                    )
+                ))
                 
             elif cloud == CloudProvider.AZURE and credentials.azure_credentials:
-                future = self.executor.submit(
+                tasks.append((
+                    CloudProvider.AZURE,
                     self._add_azure_rule,
-                    credentials.azure_credentials,
-                    target,
-                    resource_group or self.config.default_parameters.azure_resource_group,
-                    ip_address,
-                    port,
-                    protocol,
-                    description,
-                    service_name
-                )
-                futures[future] = CloudProvider.AZURE
+                    (
+                        credentials.azure_credentials,
+                        target,
+                        resource_group,
+                        ip_address,
+                        port,
+                        protocol,
+                        description,
+                        service_name
+                    )
+                ))
                 
             elif cloud == CloudProvider.GCP and credentials.gcp_credentials:
-                future = self.executor.submit(
+                tasks.append((
+                    CloudProvider.GCP,
                     self._add_gcp_rule,
-                    credentials.gcp_credentials,
-                    ip_address,
-                    port,
-                    protocol,
-                    description,
-                    service_name
-                )
-                futures[future] = CloudProvider.GCP
+                    (
+                        credentials.gcp_credentials,
+                        ip_address,
+                        port,
+                        protocol,
+                        description,
+                        service_name
+                    )
+                ))
         
-        # Collect results
-        for future in as_completed(futures):
-            cloud = futures[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to add rule to {cloud}: {str(e)}")
-                results.append(UnifiedWhitelistResult(
-                    cloud=cloud,
-                    success=False,
-                    message=f"Failed to add rule to {cloud}",
-                    error=str(e)
+        return self._run_tasks(tasks, "add rule to")
+    
+    def add_whitelist_rules_bulk(
+        self,
+        credentials: CloudCredentials,
+        target: str,  # security_group_id, nsg_name, or firewall_name
+        ip_addresses: List[str],
+        port: Optional[int] = None,
+        protocol: str = "tcp",
+        description: Optional[str] = None,
+        service_name: Optional[str] = None,
+        resource_group: Optional[str] = None  # For Azure
+    ) -> List[UnifiedWhitelistResult]:
+        """Add whitelist rules for several IP addresses to specified cloud(s).
+        
+        Every (cloud, IP) rule is dispatched onto the shared executor at once.
+        Azure rules for the target NSG are written in a single NSG update.
+        
+        Returns:
+            One result per cloud and IP address
+        """
+        # Resolve defaults once rather than in each cloud branch
+        defaults = self.config.default_parameters
+        if port is None:
+            port = defaults.port
+        resource_group = resource_group or defaults.azure_resource_group
+        
+        clouds = self._select_clouds(credentials)
+        
+        # Each task is (cloud, operation, arguments)
+        tasks: List[_CloudTask] = []
+        for cloud in clouds:
+            if cloud == CloudProvider.AWS and credentials.aws_credentials:
+                for ip_address in ip_addresses:
+                    tasks.append((
+                        CloudProvider.AWS,
+                        self._add_aws_rule,
+                        (
+                            credentials.aws_credentials,
+                            target,
+                            ip_address,
+                            port,
+                            protocol,
+                            description,
+                            service_name
+                        )
+                    ))
+                
+            elif cloud == CloudProvider.AZURE and credentials.azure_credentials:
+                tasks.append((
+                    CloudProvider.AZURE,
+                    self._add_azure_rules,
+                    (
+                        credentials.azure_credentials,
+                        target,
+                        resource_group,
+                        ip_addresses,
+                        port,
+                        protocol,
+                        description,
+                        service_name
+                    )
                 ))
+                
+            elif cloud == CloudProvider.GCP and credentials.gcp_credentials:
+                for ip_address in ip_addresses:
+                    tasks.append((
+                        CloudProvider.GCP,
+                        self._add_gcp_rule,
+                        (
+                            credentials.gcp_credentials,
+                            ip_address,
+                            port,
+                            protocol,
+                            description,
+                            service_name
+                        )
+                    ))
         
-        return results
+        return self._run_tasks(tasks, "add rules to")
     
     def remove_whitelist_rule(
         self,
@@ -167,77 +411,57 @@ class CloudServiceManager:
         resource_group: Optional[str] = None  # For Azure
     ) -> List[UnifiedWhitelistResult]:
         """Remove whitelist rules based on flexible criteria."""
-        results = []
-        
-        # Determine which clouds to target
-        clouds = []
-        if credentials.cloud == CloudProvider.ALL:
-            if credentials.aws_credentials:
-                clouds.append(CloudProvider.AWS)
-            if credentials.azure_credentials:
-                clouds.append(CloudProvider.AZURE)
-            if credentials.gcp_credentials:
-                clouds.append(CloudProvider.GCP)
-        else:
-            clouds.append(credentials.cloud)
+        resource_group = resource_group or self.config.default_parameters.azure_resource_group
         
-        # Execute operations in parallel
-        futures = {}
+        clouds = self._select_clouds(credentials)
         
+        # Each task is (cloud, operation, arguments)
+        tasks: List[_CloudTask] = []
         for cloud in clouds:
             if cloud == CloudProvider.AWS and credentials.aws_credentials:
-                future = self.executor.submit(
+                tasks.append((
+                    CloudProvider.AWS,
                     self._remove_aws_rule,
-                    credentials.aws_credentials,
-                    target,
-                    ip_address,
-                    port,
-                    service_name,
-                    protocol
-                )
-                futures[future] = CloudProvider.AWS
+                    (
+                        credentials.aws_credentials,
+                        target,
+                        ip_address,
+                        port,
+                        service_name,
+                        protocol
+                    )
+                ))
                 
             elif cloud == CloudProvider.AZURE and credentials.azure_credentials:
-                future = self.executor.submit(
+                tasks.append((
+                    CloudProvider.AZURE,
                     self._remove_azure_rule,
-                    credentials.azure_credentials,
-                    target,
-                    resource_group or self.config.default_parameters.azure_resource_group,
-                    ip_address,
-                    port,
-                    service_name,
-                    protocol
-                )
-                futures[future] = CloudProvider.AZURE
+                    (
+                        credentials.azure_credentials,
+                        target,
+                        resource_group,
+                        ip_address,
+                        port,
+                        service_name,
+                        protocol
+                    )
+                ))
                 
             elif cloud == CloudProvider.GCP and credentials.gcp_credentials:
-                future = self.executor.submit(
+                tasks.append((
+                    CloudProvider.GCP,
                     self._remove_gcp_rule,
-                    credentials.gcp_credentials,
-                    target,
-                    ip_address,
-                    port,
-                    service_name,
-                    protocol
-                )
-                futures[future] = CloudProvider.GCP
-        
-        # Collect results
-        for future in as_completed(futures):
-            cloud = futures[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to remove rule from {cloud}: {str(e)}")
-                results.append(UnifiedWhitelistResult(
-                    cloud=cloud,
-                    success=False,
-                    message=f"Failed to remove rule from {cloud}",
-                    error=str(e)
+                    (
+                        credentials.gcp_credentials,
+                        target,
+                        ip_address,
+                        port,
+                        service_name,
+                        protocol
+                    )
                 ))
         
-        return results
+        return self._run_tasks(tasks, "remove rule from")
     
     def _add_aws_rule(
         self,
@@ -251,9 +475,6 @@ class CloudServiceManager:
     ) -> UnifiedWhitelistResult:
         """Add rule to AWS security group."""
         try:
-            from whitelistmcp.utils.ip_validator import normalize_ip_input
-            from whitelistmcp.aws.service import create_rule_description
-            
             service = self._get_aws_service(credentials)
             
             # Create rule
@@ -263,7 +484,7 @@ class CloudServiceManager:
                 from_port=port,
                 to_port=port,
                 cidr_ip=normalize_ip_input(ip_address),
-                description=description or create_rule_description(
+                description=description or _aws_rule_description(
                     self.config.default_parameters.description_template,
                     service_name=service_name
                 )
@@ -275,7 +496,7 @@ class CloudServiceManager:
                 cloud=CloudProvider.AWS,
                 success=result.success,
                 message=result.message,
-                details={"rule": rule.__dict__} if result.success else None,
+                details={"rule": rule.model_dump()} if result.success else None,
                 error=result.error
             )
             
@@ -287,6 +508,27 @@ class CloudServiceManager:
                 error=str(e)
             )
     
+    def _build_azure_rule(
+        self,
+        nsg_name: str,
+        resource_group: str,
+        ip_address: str,
+        port: int,
+        protocol: str,
+        description: str
+    ) -> AzureRule:
+        """Build the NSG rule added for an IP address."""
+        return AzureRule(
+            nsg_name=nsg_name,
+            resource_group=resource_group,
+            name=_azure_rule_name(ip_address, port),
+            priority=0,  # Will be auto-assigned
+            protocol=protocol.capitalize(),
+            source_address_prefix=normalize_ip_input(ip_address),
+            destination_port_range=str(port),
+            description=description
+        )
+    
     def _add_azure_rule(
         self,
         credentials: AzureCredentials,
@@ -300,21 +542,16 @@ class CloudServiceManager:
     ) -> UnifiedWhitelistResult:
         """Add rule to Azure NSG."""
         try:
-            from whitelistmcp.utils.ip_validator import normalize_ip_input
-            from whitelistmcp.azure.service import create_rule_description
-            
             service = self._get_azure_service(credentials)
             
             # Create rule
-            rule = AzureRule(
-                nsg_name=nsg_name,
-                resource_group=resource_group,
-                name=f"allow-{ip_address.replace('.', '-').replace('/', '-')}-{port}",
-                priority=0,  # Will be auto-assigned
-                protocol=protocol.capitalize(),
-                source_address_prefix=normalize_ip_input(ip_address),
-                destination_port_range=str(port),
-                description=description or create_rule_description(
+            rule = self._build_azure_rule(
+                nsg_name,
+                resource_group,
+                ip_address,
+                port,
+                protocol,
+                description or _azure_rule_description(
                     self.config.default_parameters.description_template,
                     service_name=service_name
                 )
@@ -326,7 +563,7 @@ class CloudServiceManager:
                 cloud=CloudProvider.AZURE,
                 success=result.success,
                 message=result.message,
-                details={"rule": rule.__dict__} if result.success else None,
+                details={"rule": asdict(rule)} if result.success else None,
                 error=result.error
             )
             
@@ -338,6 +575,82 @@ class CloudServiceManager:
                 error=str(e)
             )
     
+    def _add_azure_rules(
+        self,
+        credentials: AzureCredentials,
+        nsg_name: str,
+        resource_group: str,
+        ip_addresses: List[str],
+        port: int,
+        protocol: str,
+        description: Optional[str],
+        service_name: Optional[str]
+    ) -> List[UnifiedWhitelistResult]:
+        """Add rules for several IP addresses to an Azure NSG in one update."""
+        if description:
+            descriptions = [description] * len(ip_addresses)
+        else:
+            descriptions = _azure_rule_descriptions(
+                self.config.default_parameters.description_template,
+                len(ip_addresses),
+                service_name=service_name
+            )
+        
+        # Invalid addresses fail on their own without holding back the rest.
+        # A repeated address shares the first one's rule, since one NSG update
+        # cannot hold two rules with the same name.
+        rules: List[AzureRule] = []
+        rule_positions: Dict[str, int] = {}
+        # Per address: the position of its rule, or the failure building it
+        outcomes: List[Union[int, UnifiedWhitelistResult]] = []
+        for ip_address, rule_description in zip(ip_addresses, descriptions):
+            try:
+                rule = self._build_azure_rule(
+                    nsg_name, resource_group, ip_address, port, protocol, rule_description
+                )
+            except Exception as e:
+                outcomes.append(UnifiedWhitelistResult(
+                    cloud=CloudProvider.AZURE,
+                    success=False,
+                    message="Failed to add Azure rule",
+                    error=str(e)
+                ))
+                continue
+            position = rule_positions.setdefault(rule.name, len(rules))
+            if position == len(rules):
+                rules.append(rule)
+            outcomes.append(position)
+        
+        rule_results: List[UnifiedWhitelistResult] = []
+        if rules:
+            try:
+                service = self._get_azure_service(credentials)
+                rule_results = [
+                    UnifiedWhitelistResult(
+                        cloud=CloudProvider.AZURE,
+                        success=result.success,
+                        message=result.message,
+                        details={"rule": asdict(rule)} if result.success else None,
+                        error=result.error
+                    )
+                    for rule, result in zip(rules, service.add_whitelist_rules(rules))
+                ]
+            except Exception as e:
+                rule_results = [
+                    UnifiedWhitelistResult(
+                        cloud=CloudProvider.AZURE,
+                        success=False,
+                        message="Failed to add Azure rule",
+                        error=str(e)
+                    )
+                    for _ in rules
+                ]
+        
+        return [
+            rule_results[outcome] if isinstance(outcome, int) else outcome
+            for outcome in outcomes
+        ]
+    
     def _add_gcp_rule(
         self,
         credentials: GCPCredentials,
@@ -349,27 +662,25 @@ class CloudServiceManager:
     ) -> UnifiedWhitelistResult:
         """Add rule to GCP firewall."""
         try:
-            from whitelistmcp.utils.ip_validator import normalize_ip_input
-            from whitelistmcp.gcp.service import create_rule_description
-            
             service = self._get_gcp_service(credentials)
+            defaults = self.config.default_parameters
             
             # Generate rule name
-            clean_ip = ip_address.replace('.', '-').replace('/', '-')
+            clean_ip = ip_rule_name_part(ip_address)
             rule_name = f"allow-{service_name or 'port'}-{clean_ip}-{port}"
             
             # Create rule
             rule = GCPRule(
                 name=rule_name,
                 project_id=credentials.project_id,
-                network=self.config.default_parameters.gcp_network,
+                network=defaults.gcp_network,
                 source_ranges=[normalize_ip_input(ip_address)],
                 allowed=[{
                     'IPProtocol': protocol,
                     'ports': [str(port)]
                 }],
-                description=description or create_rule_description(
-                    self.config.default_parameters.description_template,
+                description=description or _gcp_rule_description(
+                    defaults.description_template,
                     service_name=service_name
                 )
             )
@@ -380,7 +691,7 @@ class CloudServiceManager:
                 cloud=CloudProvider.GCP,
                 success=result.success,
                 message=result.message,
-                details={"rule": rule.__dict__} if result.success else None,
+                details={"rule": asdict(rule)} if result.success else None,
                 error=result.error
             )
             
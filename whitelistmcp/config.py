@@ -1,13 +1,71 @@
 """Configuration management for Multi-Cloud Whitelisting MCP Server."""
 
+import copy
+import ipaddress
 import os
 import sys
 import json
 import re
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+# orjson parses config files faster when available; it is not required
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+
+# AWS region pattern: xx-xxxx-n
+_AWS_REGION_RE = re.compile(r"^[a-z]{2}-[a-z]+-\d{1,2}$")
+
+
+def _is_aws_region(v: str) -> bool:
+    """Check an AWS region name; the dash count rejects most typos before the regex."""
+    return v.count("-") == 2 and _AWS_REGION_RE.match(v) is not None
+
+
+def _is_azure_region(v: str) -> bool:
+    """Check an Azure region name: lowercase ASCII letters and digits, starting with a letter."""
+    return v.isascii() and v.isalnum() and v.islower() and v[0].isalpha()
+
+
+# Protocols accepted for rules, in the order error messages list them;
+# -1 means all protocols
+_PROTOCOLS = ("tcp", "udp", "icmp", "-1")
+_VALID_PROTOCOLS = frozenset(_PROTOCOLS)
+
+
+# Schemas are built on first validation rather than at import, so importing
+# this module (e.g. for the CLI) does not pay for every model up front
+_MODEL_CONFIG = ConfigDict(defer_build=True)
+
+
+# Field validators shared by several models
+def _validate_aws_region(cls: Any, v: str) -> str:
+    """Validate AWS region format."""
+    if v:
+        if not _is_aws_region(v):
+            raise ValueError(f"Invalid AWS region format: {v}")
+    return v
+
+
+def _validate_azure_region(cls: Any, v: str) -> str:
+    """Validate Azure region format."""
+    if v:
+        if not _is_azure_region(v):
+            raise ValueError(f"Invalid Azure region format: {v}")
+    return v
+
+
+def _validate_port(cls: Any, v: int) -> int:
+    """Validate port number."""
+    if not 1 <= v <= 65535:
+        raise ValueError(f"Port must be between 1 and 65535, got {v}")
+    return v
 
 
 class CloudProvider(str, Enum):
@@ -18,9 +76,14 @@ class CloudProvider(str, Enum):
     ALL = "all"
 
 
+_VALID_CLOUDS = frozenset(provider.value for provider in CloudProvider)
+
+
 class CredentialProfile(BaseModel):
     """Multi-cloud credential profile configuration."""
     
+    model_config = _MODEL_CONFIG
+    
     name: str
     cloud: CloudProvider = CloudProvider.AWS
     
@@ -44,35 +107,22 @@ class CredentialProfile(BaseModel):
     gcp_credentials_json: Optional[Dict[str, Any]] = None
     gcp_region: str = "us-central1"
     
-    @field_validator("aws_region")
-    def validate_aws_region(cls, v: str) -> str:
-        """Validate AWS region format."""
-        if v:
-            # AWS region pattern: xx-xxxx-n
-            pattern = r"^[a-z]{2}-[a-z]+-\d{1,2}$"
-            if not re.match(pattern, v):
-                raise ValueError(f"Invalid AWS region format: {v}")
-        return v
+    validate_aws_region = field_validator("aws_region")(_validate_aws_region)
     
-    @field_validator("azure_region")
-    def validate_azure_region(cls, v: str) -> str:
-        """Validate Azure region format."""
-        if v:
-            # Azure regions are typically lowercase with no spaces
-            pattern = r"^[a-z]+[a-z0-9]*$"
-            if not re.match(pattern, v):
-                raise ValueError(f"Invalid Azure region format: {v}")
-        return v
+    validate_azure_region = field_validator("azure_region")(_validate_azure_region)
 
 
 class DefaultParameters(BaseModel):
     """Default parameters for whitelisting operations."""
     
+    model_config = _MODEL_CONFIG
+    
     # MCP runtime properties (shared across clouds)
     cloud_provider: CloudProvider = CloudProvider.AWS
     port: int = 22
     protocol: str = "tcp"
     description_template: str = "Added by MCP on {date} for {user}"
+    cloud_timeout: float = 120.0  # Seconds to wait on each cloud in a multi-cloud operation
     
     # AWS-specific defaults
     aws_region: str = "us-east-1"
@@ -83,6 +133,7 @@ class DefaultParameters(BaseModel):
     azure_region: str = "eastus"
     azure_resource_group: Optional[str] = None
     azure_nsg_name: Optional[str] = None
+    azure_nsg_cache_dir: Optional[str] = None  # Directory for NSG snapshots kept across restarts
     azure_location: Optional[str] = None
     
     # GCP-specific defaults
@@ -92,43 +143,27 @@ class DefaultParameters(BaseModel):
     gcp_network: str = "default"
     gcp_additive_only: bool = True
     
-    @field_validator("port")
-    def validate_port(cls, v: int) -> int:
-        """Validate port number."""
-        if not 1 <= v <= 65535:
-            raise ValueError(f"Port must be between 1 and 65535, got {v}")
-        return v
+    validate_port = field_validator("port")(_validate_port)
     
     @field_validator("protocol")
     def validate_protocol(cls, v: str) -> str:
         """Validate protocol."""
-        valid_protocols = ["tcp", "udp", "icmp", "-1"]  # -1 means all protocols
-        if v not in valid_protocols:
-            raise ValueError(f"Invalid protocol: {v}. Must be one of {valid_protocols}")
+        if v not in _VALID_PROTOCOLS:
+            raise ValueError(f"Invalid protocol: {v}. Must be one of {list(_PROTOCOLS)}")
         return v
     
-    @field_validator("aws_region")
-    def validate_aws_region(cls, v: str) -> str:
-        """Validate AWS region format."""
-        if v:
-            pattern = r"^[a-z]{2}-[a-z]+-\d{1,2}$"
-            if not re.match(pattern, v):
-                raise ValueError(f"Invalid AWS region format: {v}")
-        return v
+    validate_aws_region = field_validator("aws_region")(_validate_aws_region)
     
-    @field_validator("azure_region", "azure_location")
-    def validate_azure_region(cls, v: str) -> str:
-        """Validate Azure region format."""
-        if v:
-            pattern = r"^[a-z]+[a-z0-9]*$"
-            if not re.match(pattern, v):
-                raise ValueError(f"Invalid Azure region format: {v}")
-        return v
+    validate_azure_region = field_validator(
+        "azure_region", "azure_location"
+    )(_validate_azure_region)
 
 
 class SecuritySettings(BaseModel):
     """Security settings for the MCP server."""
     
+    model_config = _MODEL_CONFIG
+    
     require_mfa: bool = False
     allowed_ip_ranges: List[str] = Field(default_factory=list)
     max_rule_duration_hours: int = 0  # 0 means no limit
@@ -138,10 +173,13 @@ class SecuritySettings(BaseModel):
     @field_validator("allowed_ip_ranges")
     def validate_ip_ranges(cls, v: List[str]) -> List[str]:
         """Validate IP range format."""
-        cidr_pattern = r"^(\d{1,3}\.){3}\d{1,3}/\d{1,2}$"
         for ip_range in v:
-            if not re.match(cidr_pattern, ip_range):
-                raise ValueError(f"Invalid CIDR format: {ip_range}")
+            try:
+                if "/" not in ip_range:
+                    raise ValueError(ip_range)
+                ipaddress.ip_network(ip_range, strict=False)
+            except ValueError:
+                raise ValueError(f"Invalid CIDR format: {ip_range}") from None
         return v
     
     @field_validator("rate_limit_per_minute")
@@ -155,39 +193,73 @@ class SecuritySettings(BaseModel):
 class PortMapping(BaseModel):
     """Named port mapping."""
     
+    model_config = _MODEL_CONFIG
+    
     name: str
     port: int
     description: Optional[str] = None
     
-    @field_validator("port")
-    def validate_port(cls, v: int) -> int:
-        """Validate port number."""
-        if not 1 <= v <= 65535:
-            raise ValueError(f"Port must be between 1 and 65535, got {v}")
-        return v
+    validate_port = field_validator("port")(_validate_port)
+
+
+def _indexed_lookup(
+    items: List[Any],
+    index: Optional[Tuple[Any, Dict[str, int]]],
+    name: str,
+) -> Tuple[Tuple[Any, Dict[str, int]], Optional[int]]:
+    """Find the first item called ``name`` using a name -> position index.
+    
+    The index is rebuilt when the list has been replaced or resized, or when
+    the position it holds no longer points at an item with that name. A name
+    missing from a current index is trusted to be absent, so misses (such as
+    port names that fall through to the common ports) cost one dict lookup.
+    
+    Args:
+        items: Models with a ``name`` attribute
+        index: Index from a previous call, or None
+        name: Name to look up
+    
+    Returns:
+        Tuple of the (possibly rebuilt) index and the item's position, or
+        None for the position if no item has that name
+    """
+    stamp = (id(items), len(items))
+    if index is not None and index[0] == stamp:
+        position = index[1].get(name)
+        if position is None or items[position].name == name:
+            return index, position
+    positions: Dict[str, int] = {}
+    for position, item in enumerate(items):
+        positions.setdefault(item.name, position)
+    index = (stamp, positions)
+    return index, positions.get(name)
 
 
 class Config(BaseModel):
     """Main configuration for Multi-Cloud Whitelisting MCP Server."""
     
+    model_config = _MODEL_CONFIG
+    
     credential_profiles: List[CredentialProfile] = Field(default_factory=list)
     default_parameters: DefaultParameters = Field(default_factory=DefaultParameters)
     security_settings: SecuritySettings = Field(default_factory=SecuritySettings)
     port_mappings: List[PortMapping] = Field(default_factory=list)
     
+    # Name -> position lookups, built on first use and keyed on the list they index
+    _profile_index: Optional[Tuple[Any, Dict[str, int]]] = PrivateAttr(default=None)
+    _port_index: Optional[Tuple[Any, Dict[str, int]]] = PrivateAttr(default=None)
+    
     def get_profile(self, name: str) -> Optional[CredentialProfile]:
         """Get credential profile by name."""
-        for profile in self.credential_profiles:
-            if profile.name == name:
-                return profile
-        return None
+        profiles = self.credential_profiles
+        self._profile_index, position = _indexed_lookup(profiles, self._profile_index, name)
+        return None if position is None else profiles[position]
     
     def get_port_mapping(self, name: str) -> Optional[PortMapping]:
         """Get port mapping by name."""
-        for mapping in self.port_mappings:
-            if mapping.name == name:
-                return mapping
-        return None
+        mappings = self.port_mappings
+        self._port_index, position = _indexed_lookup(mappings, self._port_index, name)
+        return None if position is None else mappings[position]
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
@@ -220,9 +292,96 @@ class Config(BaseModel):
             ]
         return cls(**data)
     
+    @classmethod
+    def from_validated_dict(cls, data: Dict[str, Any]) -> "Config":
+        """Create config from a dictionary that has already been validated.
+        
+        Skips pydantic validation, so only use this for data produced by
+        ``to_dict()`` on an existing Config. Use ``from_dict`` for file or
+        user input.
+        
+        Args:
+            data: Output of ``Config.to_dict()``.
+        
+        Returns:
+            Config object built without running validators.
+        """
+        return cls.model_construct(
+            credential_profiles=[
+                CredentialProfile.model_construct(**profile)
+                for profile in data["credential_profiles"]
+            ],
+            default_parameters=DefaultParameters.model_construct(**data["default_parameters"]),
+            security_settings=SecuritySettings.model_construct(**data["security_settings"]),
+            port_mappings=[
+                PortMapping.model_construct(**mapping)
+                for mapping in data["port_mappings"]
+            ],
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        return self.model_dump()
+        """Convert config to dictionary.
+        
+        Equivalent to ``model_dump()`` but copies the field values directly,
+        which is several times faster for this fixed schema. Mutable field
+        values are copied so the result shares nothing with the config.
+        """
+        profiles = []
+        for profile in self.credential_profiles:
+            profile_dict = dict(profile.__dict__)
+            gcp_credentials_json = profile_dict["gcp_credentials_json"]
+            if gcp_credentials_json is not None:
+                profile_dict["gcp_credentials_json"] = copy.deepcopy(gcp_credentials_json)
+            profiles.append(profile_dict)
+        
+        security_settings = dict(self.security_settings.__dict__)
+        security_settings["allowed_ip_ranges"] = list(security_settings["allowed_ip_ranges"])
+        
+        return {
+            "credential_profiles": profiles,
+            "default_parameters": dict(self.default_parameters.__dict__),
+            "security_settings": security_settings,
+            "port_mappings": [dict(mapping.__dict__) for mapping in self.port_mappings],
+        }
+
+
+# Environment variables copied onto DefaultParameters as-is: (variable, field)
+_ENV_STRING_OVERRIDES = (
+    # AWS-specific
+    ("AWS_DEFAULT_REGION", "aws_region"),
+    ("AWS_DEFAULT_SECURITY_GROUP_ID", "aws_security_group_id"),
+    ("AWS_DEFAULT_VPC_ID", "aws_vpc_id"),
+    # Azure-specific
+    ("AZURE_DEFAULT_REGION", "azure_region"),
+    ("AZURE_DEFAULT_LOCATION", "azure_location"),
+    ("AZURE_DEFAULT_RESOURCE_GROUP", "azure_resource_group"),
+    ("AZURE_DEFAULT_NSG_NAME", "azure_nsg_name"),
+    ("AZURE_NSG_CACHE_DIR", "azure_nsg_cache_dir"),
+    # GCP-specific
+    ("GCP_DEFAULT_REGION", "gcp_region"),
+    ("GCP_DEFAULT_ZONE", "gcp_zone"),
+    ("GCP_PROJECT_ID", "gcp_project_id"),
+    ("GCP_DEFAULT_NETWORK", "gcp_network"),
+    # Common MCP runtime
+    ("WHITELIST_MCP_PROTOCOL", "protocol"),
+)
+
+# Integer environment overrides: (variable, config section, field, label for warnings)
+_ENV_INT_OVERRIDES = (
+    ("WHITELIST_MCP_PORT", "default_parameters", "port", "port"),
+    ("WHITELIST_MCP_RATE_LIMIT", "security_settings", "rate_limit_per_minute", "rate limit"),
+)
+
+# Environment variables load_config reads; part of its cache key
+_RELEVANT_ENV_VARS = (
+    ("CLOUD_PROVIDER", "GCP_ADDITIVE_ONLY")
+    + tuple(env_var for env_var, _ in _ENV_STRING_OVERRIDES)
+    + tuple(env_var for env_var, *_ in _ENV_INT_OVERRIDES)
+)
+
+# Resolved path -> ((mtime, size, environment), loaded config); only the
+# latest load of each path is kept
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[Any, ...], "Config"]] = {}
 
 
 def load_config(config_path: Optional[str] = None) -> Config:
@@ -252,6 +411,7 @@ def load_config(config_path: Optional[str] = None) -> Config:
         - AZURE_DEFAULT_LOCATION: Default Azure location
         - AZURE_DEFAULT_RESOURCE_GROUP: Default resource group
         - AZURE_DEFAULT_NSG_NAME: Default NSG name
+        - AZURE_NSG_CACHE_DIR: Directory for on-disk NSG snapshots
         
         GCP-specific:
         - GCP_DEFAULT_REGION: Default GCP region
@@ -260,85 +420,108 @@ def load_config(config_path: Optional[str] = None) -> Config:
         - GCP_DEFAULT_NETWORK: Default VPC network
         - GCP_ADDITIVE_ONLY: Enable additive-only mode
     """
-    # Start with default config
-    config_dict: Dict[str, Any] = {}
-    
-    # Load from file if it exists
     if config_path is None:
         config_path = "mcp_config.json"
     
+    # Reuse an earlier load while the file and relevant environment are unchanged
     config_file = Path(config_path)
-    if config_file.exists():
+    path_key = str(config_file.resolve())
+    try:
+        stat = config_file.stat()
+        file_stamp: Tuple[Any, ...] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_stamp = (None, None)
+    env_stamp = tuple((name, os.environ.get(name)) for name in _RELEVANT_ENV_VARS)
+    stamp = file_stamp + (env_stamp,)
+    
+    entry = _CONFIG_CACHE.get(path_key)
+    if entry is not None and entry[0] == stamp:
+        cached = entry[1]
+    else:
+        cached = _load_config_uncached(config_file)
+        _CONFIG_CACHE[path_key] = (stamp, cached)
+    # Callers may modify the config they get back; the cached copy was
+    # validated when it was loaded, so rebuild from a fresh dump without
+    # running the validators again
+    return Config.from_validated_dict(cached.to_dict())
+
+
+def _default_config() -> Config:
+    """Build the all-defaults Config that load_config produces with no file or environment."""
+    return Config.model_construct(
+        credential_profiles=[],
+        default_parameters=DefaultParameters.model_construct(),
+        security_settings=SecuritySettings.model_construct(),
+        port_mappings=[],
+    )
+
+
+def _load_config_uncached(config_file: Path) -> Config:
+    """Build a Config from a file and the environment, without caching."""
+    # Nothing to apply: skip validation and schema building altogether
+    environ = os.environ
+    file_exists = config_file.exists()
+    if not file_exists and not any(name in environ for name in _RELEVANT_ENV_VARS):
+        return _default_config()
+    
+    # Start with default config
+    config_dict: Dict[str, Any] = {}
+    
+    # Load from file if it exists
+    if file_exists:
         try:
-            with open(config_file, "r") as f:
-                file_config = json.load(f)
+            with open(config_file, "rb") as f:
+                file_config = _json_loads(f.read())
                 config_dict = file_config  # Replace entire dict, not update
         except Exception as e:
             # Log error but continue with defaults
-            print(f"Warning: Failed to load config file {config_path}: {e}", file=sys.stderr)
+            print(f"Warning: Failed to load config file {config_file}: {e}", file=sys.stderr)
     
     # Create config object
     config = Config.from_dict(config_dict)
     
     # Override with environment variables
     # Cloud provider selection
-    cloud_provider = os.environ.get("CLOUD_PROVIDER", "aws").lower()
-    if cloud_provider in ["aws", "azure", "gcp", "all"]:
+    cloud_provider = environ.get("CLOUD_PROVIDER", "aws").lower()
+    if cloud_provider in _VALID_CLOUDS:
         config.default_parameters.cloud_provider = CloudProvider(cloud_provider)
     
-    # AWS-specific overrides
-    if "AWS_DEFAULT_REGION" in os.environ:
-        config.default_parameters.aws_region = os.environ["AWS_DEFAULT_REGION"]
-    if "AWS_DEFAULT_SECURITY_GROUP_ID" in os.environ:
-        config.default_parameters.aws_security_group_id = os.environ["AWS_DEFAULT_SECURITY_GROUP_ID"]
-    if "AWS_DEFAULT_VPC_ID" in os.environ:
-        config.default_parameters.aws_vpc_id = os.environ["AWS_DEFAULT_VPC_ID"]
-    
-    # Azure-specific overrides
-    if "AZURE_DEFAULT_REGION" in os.environ:
-        config.default_parameters.azure_region = os.environ["AZURE_DEFAULT_REGION"]
-    if "AZURE_DEFAULT_LOCATION" in os.environ:
-        config.default_parameters.azure_location = os.environ["AZURE_DEFAULT_LOCATION"]
-    if "AZURE_DEFAULT_RESOURCE_GROUP" in os.environ:
-        config.default_parameters.azure_resource_group = os.environ["AZURE_DEFAULT_RESOURCE_GROUP"]
-    if "AZURE_DEFAULT_NSG_NAME" in os.environ:
-        config.default_parameters.azure_nsg_name = os.environ["AZURE_DEFAULT_NSG_NAME"]
-    
-    # GCP-specific overrides
-    if "GCP_DEFAULT_REGION" in os.environ:
-        config.default_parameters.gcp_region = os.environ["GCP_DEFAULT_REGION"]
-    if "GCP_DEFAULT_ZONE" in os.environ:
-        config.default_parameters.gcp_zone = os.environ["GCP_DEFAULT_ZONE"]
-    if "GCP_PROJECT_ID" in os.environ:
-        config.default_parameters.gcp_project_id = os.environ["GCP_PROJECT_ID"]
-    if "GCP_DEFAULT_NETWORK" in os.environ:
-        config.default_parameters.gcp_network = os.environ["GCP_DEFAULT_NETWORK"]
-    gcp_additive = os.environ.get("GCP_ADDITIVE_ONLY", "true").lower()
+    # Plain string overrides of default parameters
+    for env_var, attr in _ENV_STRING_OVERRIDES:
+        value = environ.get(env_var)
+        if value is not None:
+            setattr(config.default_parameters, attr, value)
+    
+    gcp_additive = environ.get("GCP_ADDITIVE_ONLY", "true").lower()
     config.default_parameters.gcp_additive_only = gcp_additive != "false"
     
-    # Common MCP runtime overrides
-    if "WHITELIST_MCP_PORT" in os.environ:
+    # Integer overrides; bad values are reported and ignored
+    for env_var, section, attr, label in _ENV_INT_OVERRIDES:
+        value = environ.get(env_var)
+        if value is None:
+            continue
         try:
-            config.default_parameters.port = int(os.environ["WHITELIST_MCP_PORT"])
+            setattr(getattr(config, section), attr, int(value))
         except ValueError:
-            print(f"Warning: Invalid port in WHITELIST_MCP_PORT: {os.environ['WHITELIST_MCP_PORT']}", file=sys.stderr)
-    
-    if "WHITELIST_MCP_PROTOCOL" in os.environ:
-        config.default_parameters.protocol = os.environ["WHITELIST_MCP_PROTOCOL"]
-    
-    if "WHITELIST_MCP_RATE_LIMIT" in os.environ:
-        try:
-            config.security_settings.rate_limit_per_minute = int(os.environ["WHITELIST_MCP_RATE_LIMIT"])
-        except ValueError:
-            print(
-                f"Warning: Invalid rate limit in WHITELIST_MCP_RATE_LIMIT: "
-                f"{os.environ['WHITELIST_MCP_RATE_LIMIT']}",
-                file=sys.stderr
-            )
+            print(f"Warning: Invalid {label} in {env_var}: {value}", file=sys.stderr)
     
     return config
 
 
+# Well-known service names get_port_number accepts without a port mapping
+_COMMON_PORTS = {
+    "ssh": 22,
+    "telnet": 23,
+    "smtp": 25,
+    "http": 80,
+    "https": 443,
+    "rdp": 3389,
+    "mysql": 3306,
+    "postgresql": 5432,
+    "mongodb": 27017,
+}
+
+
 def get_port_number(port_input: str, config: Config) -> int:
     """Get port number from input string or mapping.
     
@@ -352,15 +535,17 @@ def get_port_number(port_input: str, config: Config) -> int:
     Raises:
         ValueError: If port is invalid
     """
-    # Try to parse as integer
-    try:
-        port = int(port_input)
+    # Numeric ports; checking the characters first keeps named ports off the
+    # exception path. Surrounding whitespace and a leading "+" are accepted,
+    # as int() accepts them.
+    digits = port_input.strip()
+    if digits[:1] == "+":
+        digits = digits[1:]
+    if digits.isascii() and digits.isdigit():
+        port = int(digits)
         if 1 <= port <= 65535:
             return port
-        else:
-            raise ValueError(f"Port must be between 1 and 65535, got {port}")
-    except ValueError:
-        pass
+        raise ValueError(f"Invalid port: {port_input}. Port must be between 1 and 65535")
     
     # Try to find in port mappings
     mapping = config.get_port_mapping(port_input)
@@ -368,19 +553,8 @@ def get_port_number(port_input: str, config: Config) -> int:
         return mapping.port
     
     # Common port names
-    common_ports = {
-        "ssh": 22,
-        "telnet": 23,
-        "smtp": 25,
-        "http": 80,
-        "https": 443,
-        "rdp": 3389,
-        "mysql": 3306,
-        "postgresql": 5432,
-        "mongodb": 27017,
-    }
-    
-    if port_input.lower() in common_ports:
-        return common_ports[port_input.lower()]
+    common_port = _COMMON_PORTS.get(port_input.lower())
+    if common_port is not None:
+        return common_port
     
     raise ValueError(f"Invalid port: {port_input}")
\ No newline at end of file
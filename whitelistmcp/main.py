@@ -10,6 +10,7 @@ from whitelistmcp.config import load_config
 from whitelistmcp.utils.logging import setup_logging, get_logger
 from whitelistmcp.mcp.handler import (
     MCPHandler,
+    MCPResponse,
     validate_mcp_request,
     create_mcp_error,
     ERROR_PARSE,
@@ -68,12 +69,12 @@ class MCPServer:
                 # Process batch request
                 responses = []
                 for single_request in data:
-                    response = self._process_single_request(single_request)
+                    response = self._handle_single_request(single_request)
                     if response is not None:  # Don't include notification responses
-                        responses.append(json.loads(response))
+                        responses.append(response.model_dump_json(exclude_none=True))
                 
                 # Return batch response only if there are responses
-                return json.dumps(responses) if responses else None
+                return f"[{','.join(responses)}]" if responses else None
             else:
                 # Process single request
                 return self._process_single_request(data)
@@ -88,7 +89,7 @@ class MCPServer:
                 "Parse error",
                 {"error": str(e)}
             )
-            return json.dumps(response.model_dump(exclude_none=True))
+            return response.model_dump_json(exclude_none=True)
         except Exception as e:
             self.logger.exception("Unexpected error processing request")
             response = create_mcp_error(
@@ -97,7 +98,7 @@ class MCPServer:
                 "Internal error",
                 {"error": str(e)}
             )
-            return json.dumps(response.model_dump(exclude_none=True))
+            return response.model_dump_json(exclude_none=True)
     
     def _process_single_request(self, request_dict: Dict[str, Any]) -> Optional[str]:
         """Process a single request object.
@@ -108,6 +109,18 @@ class MCPServer:
         Returns:
             JSON response string or None for notifications
         """
+        response = self._handle_single_request(request_dict)
+        return response.model_dump_json(exclude_none=True) if response is not None else None
+    
+    def _handle_single_request(self, request_dict: Dict[str, Any]) -> Optional[MCPResponse]:
+        """Handle a single request object.
+        
+        Args:
+            request_dict: Parsed request dictionary
+        
+        Returns:
+            MCPResponse or None for notifications
+        """
         request_id = request_dict.get("id", "unknown")
         
         try:
@@ -127,7 +140,7 @@ class MCPServer:
                     "Invalid Request",
                     {"error": str(e)}
                 )
-                return json.dumps(response.model_dump(exclude_none=True))
+                return response
             
             # Check if this is a notification (no id field)
             if request.id is None:
@@ -152,7 +165,7 @@ class MCPServer:
                     "Duplicate request ID",
                     {"id": request.id}
                 )
-                return json.dumps(response.model_dump(exclude_none=True))
+                return response
             
             # Track this ID
             self.used_ids.add(request.id)
@@ -181,7 +194,7 @@ class MCPServer:
                     "success": response.result.get("success", False) if response.result else False
                 })
             
-            return json.dumps(response.model_dump(exclude_none=True))
+            return response
             
         except Exception as e:
             self.logger.exception("Unexpected error", extra={
@@ -194,7 +207,7 @@ class MCPServer:
                 "Internal error",
                 {"error": str(e)}
             )
-            return json.dumps(response.model_dump(exclude_none=True))
+            return response
     
     def run(self) -> None:
         """Run the MCP server, reading from stdin and writing to stdout."""
@@ -223,8 +236,13 @@ class MCPServer:
         self.logger.info("MCP server stopped")
 
 
-def main() -> None:
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point.
+    
+    Args:
+        argv: Command-line arguments, excluding the program name.
+            Defaults to sys.argv[1:].
+    """
     parser = argparse.ArgumentParser(
         description="AWS Whitelisting MCP Server",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -249,7 +267,7 @@ def main() -> None:
         version=f"%(prog)s {__version__}"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Create and run server
     server = MCPServer(config_path=args.config)
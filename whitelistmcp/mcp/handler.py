@@ -93,7 +93,7 @@ def validate_mcp_request(request_data: Any) -> MCPRequest:
     if not isinstance(request_data, dict):
         raise ValueError("Request must be a JSON object")
     
-    return MCPRequest(**request_data)
+    return MCPRequest.model_validate(request_data)
 
 
 def create_mcp_response(request_id: str, result: Dict[str, Any]) -> MCPResponse:
@@ -1,14 +1,21 @@
 """
 Remote MCP Server implementation with HTTP/WebSocket support
 """
+import asyncio
 import json
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from aiohttp import web
 import aiohttp_cors
 
-from .mcp.handler import MCPHandler
+from .mcp.handler import (
+    ERROR_INVALID_REQUEST,
+    MCPHandler,
+    MCPResponse,
+    create_mcp_error,
+    validate_mcp_request
+)
 from .config import Config
 
 logger = logging.getLogger(__name__)
@@ -99,28 +106,27 @@ class RemoteMCPServer:
         try:
             data = await request.json()
             
+            # Cloud SDK calls block, so requests are handled on the default
+            # executor to keep the event loop serving other clients meanwhile
+            loop = asyncio.get_running_loop()
+            
             # Handle as JSON-RPC request
             if isinstance(data, dict):
-                response = self.mcp_handler.handle_request(data)
+                response = await loop.run_in_executor(None, self._handle_single, data)
+                if response is None:
+                    return web.Response(status=204)  # No content for notifications
+                return web.json_response(response.model_dump(exclude_none=True))
             elif isinstance(data, list):
-                # Batch request
-                responses = []
-                for req in data:
-                    resp = self.mcp_handler.handle_request(req)
-                    if resp is not None:
-                        responses.append(resp)
-                response = responses if responses else None
+                responses = await loop.run_in_executor(None, self._handle_batch, data)
+                if responses is None:
+                    return web.Response(status=204)  # No content for notifications
+                return web.json_response([r.model_dump(exclude_none=True) for r in responses])
             else:
                 return web.json_response(
                     {"error": "Invalid request format"}, 
                     status=400
                 )
             
-            if response is None:
-                return web.Response(status=204)  # No content for notifications
-            
-            return web.json_response(response)
-            
         except json.JSONDecodeError:
             return web.json_response(
                 {"error": "Invalid JSON"}, 
@@ -133,6 +139,30 @@ class RemoteMCPServer:
                 status=500
             )
     
+    def _handle_single(self, data: Dict[str, Any]) -> Optional[MCPResponse]:
+        """Validate and handle one JSON-RPC request; notifications get no response."""
+        try:
+            request = validate_mcp_request(data)
+        except ValueError as e:
+            return create_mcp_error(
+                data.get("id", "unknown"),
+                ERROR_INVALID_REQUEST,
+                "Invalid Request",
+                {"error": str(e)}
+            )
+        if request.id is None:
+            return None
+        return self.mcp_handler.handle_request(request)
+    
+    def _handle_batch(self, data: List[Dict[str, Any]]) -> Optional[List[MCPResponse]]:
+        """Handle a JSON-RPC batch, dropping notification responses."""
+        responses = []
+        for req in data:
+            resp = self._handle_single(req)
+            if resp is not None:
+                responses.append(resp)
+        return responses if responses else None
+    
     def run(self) -> None:
         """Start the remote server"""
         logger.info(f"Starting Remote MCP Server on {self.host}:{self.port}")
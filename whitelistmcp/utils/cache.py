@@ -0,0 +1,82 @@
+"""Caching utilities for objects built from cloud credentials."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    """Make a credential value usable in a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    hashable: Hashable = value
+    return hashable
+
+
+def credentials_digest(*parts: Any) -> str:
+    """Digest credential values into a cache key, so secrets are not kept as keys.
+    
+    Args:
+        parts: Credential values; dicts and lists are digested by content
+    
+    Returns:
+        Hex SHA-256 digest of the values
+    """
+    return hashlib.sha256(repr(_freeze(parts)).encode("utf-8")).hexdigest()
+
+
+class CredentialCache(Generic[T]):
+    """Thread-safe LRU cache of objects built from credentials.
+    
+    Entries are keyed by credentials_digest of the credential values. Objects
+    are built outside the lock, so a slow build does not hold up lookups for
+    other credentials; when two threads build for the same credentials at
+    once, the first object stored is the one both get.
+    """
+    
+    def __init__(self, max_entries: int):
+        """Initialize an empty cache.
+        
+        Args:
+            max_entries: Most objects kept; the least recently used are dropped first
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, T]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_create(self, factory: Callable[[], T], *credentials: Any) -> T:
+        """Return the object cached for credentials, building it with factory if missing.
+        
+        Args:
+            factory: Builds the object on a miss
+            credentials: Credential values identifying the object
+        
+        Returns:
+            Cached or newly built object
+        """
+        key = credentials_digest(*credentials)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        
+        value = factory()
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+    
+    def clear(self) -> None:
+        """Drop every cached object."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,8 @@
+"""Compatibility helpers for the supported Python versions."""
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments for @dataclass giving instances __slots__; slots needs
+# Python 3.10+, so older interpreters keep a per-instance __dict__
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -2,7 +2,6 @@
 
 import re
 from typing import Dict, Any, Optional
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 from pydantic import BaseModel, field_validator
 
@@ -64,6 +63,9 @@ def validate_credentials(credentials: AWSCredentials) -> Dict[str, Any]:
     if not isinstance(credentials, AWSCredentials):
         raise CredentialValidationError("Invalid credentials format")
     
+    # Imported here so loading this module does not pull in boto3
+    import boto3
+    
     try:
         # Create STS client with provided credentials
         sts_client = boto3.client(
@@ -1,11 +1,26 @@
 """IP address validation utilities."""
 
 import ipaddress
+import re
 import socket
 from typing import Optional, Dict, Any
 import requests
 from requests.exceptions import RequestException
 
+# Host-prefix suffixes appended to single addresses by normalize_ip_input
+_SLASH32 = "/32"
+_SLASH128 = "/128"
+
+# Canonical dotted-quad IPv4 (no leading zeros), optionally with a /0-32
+# prefix. Anything these accept ipaddress accepts too, so a match can skip the
+# full parser; non-matches still fall through to ipaddress.
+_IPV4_OCTET = r"(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])"
+_IPV4_RE = re.compile(rf"{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}")
+_IPV4_CIDR_RE = re.compile(rf"{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}/(?:3[0-2]|[12]?[0-9])")
+
+# Characters of an IP or CIDR that are not allowed in cloud rule names
+_RULE_NAME_TABLE = str.maketrans({".": "-", "/": "-", ":": "-"})
+
 
 class IPValidationError(Exception):
     """Exception raised for IP validation errors."""
@@ -24,6 +39,9 @@ def validate_ip_address(ip: Optional[str]) -> bool:
     if not ip:
         return False
     
+    if _IPV4_RE.fullmatch(ip):
+        return True
+    
     try:
         ipaddress.ip_address(ip)
         return True
@@ -43,6 +61,9 @@ def validate_cidr_block(cidr: Optional[str]) -> bool:
     if not cidr:
         return False
     
+    if _IPV4_CIDR_RE.fullmatch(cidr):
+        return True
+    
     try:
         ipaddress.ip_network(cidr, strict=False)
         return True
@@ -174,12 +195,11 @@ def normalize_ip_input(ip_input: str) -> str:
     
     # Check if it's a valid IP address
     if validate_ip_address(ip_input):
-        # Convert single IP to /32 (IPv4) or /128 (IPv6) CIDR
-        ip_obj = ipaddress.ip_address(ip_input)
-        if isinstance(ip_obj, ipaddress.IPv4Address):
-            return f"{ip_input}/32"
-        else:
-            return f"{ip_input}/128"
+        # Convert single IP to /32 (IPv4) or /128 (IPv6) CIDR; only a valid
+        # IPv6 address can contain a colon, so no second parse is needed
+        if ":" in ip_input:
+            return ip_input + _SLASH128
+        return ip_input + _SLASH32
     
     raise IPValidationError(f"Invalid IP address or CIDR block: {ip_input}")
 
@@ -223,4 +243,16 @@ def cidr_overlap(cidr1: str, cidr2: str) -> bool:
         network2 = ipaddress.ip_network(cidr2, strict=False)
         return network1.overlaps(network2)
     except ValueError as e:
-        raise ValueError(f"Invalid CIDR block: {e}") from e
\ No newline at end of file
+        raise ValueError(f"Invalid CIDR block: {e}") from e
+
+
+def ip_rule_name_part(ip: str) -> str:
+    """Make an IP address or CIDR block usable in a cloud rule name.
+    
+    Args:
+        ip: IP address or CIDR block (e.g., "10.0.0.0/24")
+    
+    Returns:
+        The address with separators replaced by dashes (e.g., "10-0-0-0-24")
+    """
+    return ip.translate(_RULE_NAME_TABLE)